@@ -1,17 +1,29 @@
 import sys
 import os
 import csv
-import shutil
 import sqlite3
 import json
+import threading
+import functools
+import time
+from contextlib import contextmanager, closing
+from urllib.request import pathname2url
 from datetime import datetime, timedelta
 
-from PyQt5.QtCore import QTimer, Qt, QPoint, QDateTime, QUrl
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
+try:
+    import orjson  # optional, faster study_time.json encode/decode
+except ImportError:
+    orjson = None
+
+from PyQt5.QtCore import (
+    QTimer, Qt, QPoint, QDateTime, QUrl, QAbstractListModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QBrush
 from PyQt5.QtMultimedia import QSound, QMediaPlayer, QMediaContent
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QListWidgetItem, QPushButton, QLabel, QLineEdit, QMessageBox, QComboBox,
+    QListView, QPushButton, QLabel, QLineEdit, QMessageBox, QComboBox,
     QSystemTrayIcon, QFileDialog, QDialog, QDialogButtonBox, QFormLayout, QDateTimeEdit,
     QCheckBox, QMenu, QAction, QTextEdit, QSpinBox, QStyle, QGraphicsDropShadowEffect,
     QScrollArea
@@ -20,23 +32,99 @@ from PyQt5.QtWidgets import (
 DB_PATH = 'tasks.db'
 BACKUP_PATH = 'tasks_backup.db'
 STUDY_TIME_FILE = 'study_time.json'
+BACKUP_INTERVAL_MS = 5 * 60 * 1000
+# Typing pause before the search box queries the database
+SEARCH_DEBOUNCE_MS = 150
+
+# Combo box choices shared by quick add and the task dialog; the maps give the
+# plain value stored in the tasks table for each displayed entry.
+CATEGORIES = ('📖 Study', '📝 Homework', '💼 Work', '🏠 Personal')
+PRIORITIES = ('⚪ Medium', '🔴 High', '🟢 Low')
+CATEGORY_DB_MAP = {'📖 Study': 'Study', '📝 Homework': 'Homework', '💼 Work': 'Work', '🏠 Personal': 'Personal'}
+PRIORITY_DB_MAP = {'⚪ Medium': 'Medium', '🔴 High': 'High', '🟢 Low': 'Low'}
+
+# Shared connections, opened once by init_db(). Writes go through _CONN,
+# list reads through the read-only _RO_CONN so they never wait on a writer.
+_CONN = None
+_RO_CONN = None
+_DB_LOCK = threading.RLock()
+_RO_LOCK = threading.Lock()
+
+# Task statements, kept as constants so each connection's statement cache reuses them
+SQL_ADD_TASK = """INSERT INTO tasks
+    (task, category, completed, duedate, subtasks, started_at, completed_at, priority, tags, recurring, pomodoros, last_pomodoro_at)
+    VALUES (?, ?, 0, ?, ?, ?, ?, ?, ?, ?, 0, NULL)"""
+# Show pending tasks first, and within each group show newest first
+SQL_SELECT_TASKS = "SELECT * FROM tasks ORDER BY completed ASC, id DESC"
+# The task list shows every column except last_pomodoro_at
+_DISPLAY_COLUMNS = ("id, task, category, completed, duedate, subtasks, started_at, "
+                    "completed_at, priority, tags, recurring, pomodoros")
+SQL_SELECT_DISPLAY_TASKS = f"SELECT {_DISPLAY_COLUMNS} FROM tasks ORDER BY completed ASC, id DESC"
+SQL_SELECT_TASK = f"SELECT {_DISPLAY_COLUMNS} FROM tasks WHERE id = ?"
+# instr() rather than LIKE so '%' and '_' in the query match literally;
+# py_lower is str.lower, since SQLite's lower() only folds ASCII
+SQL_SEARCH_TASKS = f"""SELECT {_DISPLAY_COLUMNS} FROM tasks
+    WHERE instr(py_lower(IFNULL(task,'') || ' ' || IFNULL(tags,'')), ?) > 0
+    ORDER BY completed ASC, id DESC"""
+SQL_COMPLETE_TASK = "UPDATE tasks SET completed = 1, completed_at = ? WHERE id = ?"
+SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+SQL_INC_POMODORO = "UPDATE tasks SET pomodoros = IFNULL(pomodoros,0)+1, last_pomodoro_at = ? WHERE id = ?"
+SQL_IMPORT_TASK = """INSERT OR REPLACE INTO tasks
+    (id, task, category, completed, duedate, subtasks, started_at, completed_at, priority, tags, recurring, pomodoros, last_pomodoro_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Statistics dialog: all counters in a single pass over tasks
+SQL_STATS_SUMMARY = """SELECT COUNT(*),
+    COALESCE(SUM(completed=1), 0),
+    COALESCE(SUM(pomodoros), 0)
+    FROM tasks"""
+# Half-open [day, next day) range on the ISO text so idx_tasks_completed_at can serve it
+SQL_STATS_DONE_TODAY = """SELECT COUNT(*) FROM tasks
+    WHERE completed=1 AND completed_at >= ? AND completed_at < ?"""
+SQL_STATS_LATEST = "SELECT task, pomodoros FROM tasks ORDER BY last_pomodoro_at DESC LIMIT 1"
+
+# Indexes behind the task list ORDER BY, due-date lookups and the stats queries
+_DB_INDEXES = (
+    ("idx_tasks_completed_id", "CREATE INDEX IF NOT EXISTS idx_tasks_completed_id ON tasks(completed ASC, id DESC)"),
+    ("idx_tasks_duedate", "CREATE INDEX IF NOT EXISTS idx_tasks_duedate ON tasks(duedate)"),
+    ("idx_tasks_completed_at", "CREATE INDEX IF NOT EXISTS idx_tasks_completed_at ON tasks(completed, completed_at)"),
+    ("idx_tasks_last_pomo", "CREATE INDEX IF NOT EXISTS idx_tasks_last_pomo ON tasks(last_pomodoro_at DESC)"),
+)
+
+# Per-connection tuning; journal_mode/wal_autocheckpoint are set on the writer.
+_DB_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
 
 # -------- Helper: resource path for PyInstaller (onefile/onedir) --------
+_RESOURCE_BASE = getattr(sys, '_MEIPASS', None) or os.path.abspath('.')
+
+@functools.lru_cache(maxsize=64)
 def resource_path(relative_path: str) -> str:
-    try:
-        base_path = getattr(sys, '_MEIPASS', None)
-        if base_path:
-            return os.path.join(base_path, relative_path)
-    except Exception:
-        pass
-    return os.path.join(os.path.abspath('.'), relative_path)
+    return os.path.join(_RESOURCE_BASE, relative_path)
+
+# Parsed study_time.json, kept in memory so UI ticks do not hit the disk.
+# 'dirty' marks seconds added since the last write to the file.
+_STUDY_CACHE = {'secs': None, 'dirty': False}
+_STUDY_FLUSH_TIMER = None
+STUDY_FLUSH_DELAY_MS = 2000
 
 def load_study_time():
+    """Return total study time in seconds, reading the file only on first use."""
+    if _STUDY_CACHE['secs'] is None:
+        _STUDY_CACHE['secs'] = _read_study_time_file()
+    return _STUDY_CACHE['secs']
+
+def _read_study_time_file():
     """Return total study time in seconds. Handles legacy minutes and string values."""
     try:
         if os.path.exists(STUDY_TIME_FILE):
-            with open(STUDY_TIME_FILE, 'r') as f:
-                data = json.load(f) or {}
+            with open(STUDY_TIME_FILE, 'rb') as f:
+                data = (orjson or json).loads(f.read()) or {}
                 # Prefer seconds; coerce to int
                 if 'total_seconds' in data:
                     try:
@@ -63,141 +151,294 @@ def load_study_time():
 
 def save_study_time(seconds):
     try:
-        secs = int(float(seconds or 0))
-        data = {'total_seconds': max(0, secs)}
-        with open(STUDY_TIME_FILE, 'w') as f:
-            json.dump(data, f)
+        secs = max(0, int(float(seconds or 0)))
+        _STUDY_CACHE['secs'] = secs
+        _STUDY_CACHE['dirty'] = False
+        data = {'total_seconds': secs}
+        if orjson is not None:
+            raw = orjson.dumps(data)
+        else:
+            raw = json.dumps(data, separators=(',', ':')).encode()
+        with open(STUDY_TIME_FILE, 'wb') as f:
+            f.write(raw)
     except Exception:
         pass
 
 def add_study_time(seconds):
-    current = load_study_time()
-    new_total = current + seconds
-    save_study_time(new_total)
+    """Add to the in-memory total; the file write is coalesced by flush_study_time()."""
+    new_total = max(0, load_study_time() + int(seconds))
+    _STUDY_CACHE['secs'] = new_total
+    _STUDY_CACHE['dirty'] = True
+    _schedule_study_flush()
     return new_total
 
+def flush_study_time():
+    """Write pending study time to disk now."""
+    if _STUDY_FLUSH_TIMER is not None:
+        _STUDY_FLUSH_TIMER.stop()
+    if _STUDY_CACHE['dirty']:
+        save_study_time(_STUDY_CACHE['secs'])
+
+def _schedule_study_flush():
+    global _STUDY_FLUSH_TIMER
+    if QApplication.instance() is None:
+        flush_study_time()
+        return
+    if _STUDY_FLUSH_TIMER is None:
+        _STUDY_FLUSH_TIMER = QTimer()
+        _STUDY_FLUSH_TIMER.setSingleShot(True)
+        _STUDY_FLUSH_TIMER.setInterval(STUDY_FLUSH_DELAY_MS)
+        _STUDY_FLUSH_TIMER.timeout.connect(flush_study_time)
+    if not _STUDY_FLUSH_TIMER.isActive():
+        _STUDY_FLUSH_TIMER.start()
+
+# (upper bound, major unit secs, major label, minor unit secs, minor label)
+_STUDY_TIME_UNITS = (
+    (3600, 60, 'm', 1, 's'),
+    (86400, 3600, 'h', 60, 'm'),
+    (31536000, 86400, 'd', 3600, 'h'),
+    (None, 31536000, 'y', 86400, 'd'),
+)
+# Last formatted value; above an hour the text only changes once a minute
+_FMT_CACHE = {'bucket': -1, 'str': ''}
+
 def format_study_time(seconds):
     if seconds < 60:
         return f"{seconds} seconds"
-    elif seconds < 3600:  # 1 hour
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes}m {secs}s"
-    elif seconds < 86400:  # 24 hours
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        return f"{hours}h {minutes}m"
-    elif seconds < 31536000:  # 365 days
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
-        return f"{days}d {hours}h"
-    else:
-        years = seconds // 31536000
-        days = (seconds % 31536000) // 86400
-        return f"{years}y {days}d"
+    bucket = seconds if seconds < 3600 else seconds - seconds % 60
+    if bucket == _FMT_CACHE['bucket']:
+        return _FMT_CACHE['str']
+    for limit, major, major_label, minor, minor_label in _STUDY_TIME_UNITS:
+        if limit is None or seconds < limit:
+            a, rest = divmod(seconds, major)
+            text = f"{a}{major_label} {rest // minor}{minor_label}"
+            break
+    _FMT_CACHE['bucket'] = bucket
+    _FMT_CACHE['str'] = text
+    return text
+
+def _connect(target, uri=False):
+    # Autocommit (transactions are explicit via db_transaction), no column type
+    # sniffing, and a statement cache large enough for every SQL_* constant.
+    return sqlite3.connect(target, uri=uri, detect_types=0, isolation_level=None,
+                           check_same_thread=False, cached_statements=256)
+
+def _apply_pragmas(conn):
+    for pragma in _DB_PRAGMAS:
+        conn.execute(pragma)
+
+@contextmanager
+def db_transaction(immediate=False):
+    """Run the enclosed writes on the shared connection as one transaction.
+
+    Nested use joins the outer transaction. immediate=True takes SQLite's
+    write lock at BEGIN, so a bulk write cannot hit SQLITE_BUSY halfway.
+    """
+    with _DB_LOCK:
+        if _CONN.in_transaction:
+            yield _CONN
+            return
+        _CONN.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield _CONN
+        except BaseException:
+            _CONN.execute("ROLLBACK")
+            raise
+        _CONN.execute("COMMIT")
 
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("""CREATE TABLE IF NOT EXISTS tasks (
-                 id INTEGER PRIMARY KEY,
-                 task TEXT,
-                 category TEXT,
-                 completed INTEGER,
-                 duedate TEXT,
-                 subtasks TEXT,
-                 started_at TEXT,
-                 completed_at TEXT
-                 )""")
-    conn.commit()
-
-    cols = {row[1] for row in c.execute("PRAGMA table_info(tasks)").fetchall()}
-    to_add = []
-    if 'priority' not in cols:
-        to_add.append(("ALTER TABLE tasks ADD COLUMN priority TEXT DEFAULT 'Medium'",))
-    if 'tags' not in cols:
-        to_add.append(("ALTER TABLE tasks ADD COLUMN tags TEXT DEFAULT ''",))
-    if 'recurring' not in cols:
-        to_add.append(("ALTER TABLE tasks ADD COLUMN recurring TEXT DEFAULT 'None'",))
-    if 'pomodoros' not in cols:
-        to_add.append(("ALTER TABLE tasks ADD COLUMN pomodoros INTEGER DEFAULT 0",))
-    if 'last_pomodoro_at' not in cols:
-        to_add.append(("ALTER TABLE tasks ADD COLUMN last_pomodoro_at TEXT",))
-
-    for (stmt,) in to_add:
-        c.execute(stmt)
-        conn.commit()
-
-    conn.close()
+    global _CONN, _RO_CONN
+    _CONN = _connect(DB_PATH)
+    _CONN.execute("PRAGMA journal_mode=WAL")
+    _CONN.execute("PRAGMA wal_autocheckpoint=1000")
+    _apply_pragmas(_CONN)
+    # Schema creation and column migrations share a single transaction
+    with db_transaction() as conn:
+        c = conn.cursor()
+        c.execute("""CREATE TABLE IF NOT EXISTS tasks (
+                     id INTEGER PRIMARY KEY,
+                     task TEXT,
+                     category TEXT,
+                     completed INTEGER,
+                     duedate TEXT,
+                     subtasks TEXT,
+                     started_at TEXT,
+                     completed_at TEXT
+                     )""")
+
+        cols = {row[1] for row in c.execute("PRAGMA table_info(tasks)").fetchall()}
+        to_add = []
+        if 'priority' not in cols:
+            to_add.append(("ALTER TABLE tasks ADD COLUMN priority TEXT DEFAULT 'Medium'",))
+        if 'tags' not in cols:
+            to_add.append(("ALTER TABLE tasks ADD COLUMN tags TEXT DEFAULT ''",))
+        if 'recurring' not in cols:
+            to_add.append(("ALTER TABLE tasks ADD COLUMN recurring TEXT DEFAULT 'None'",))
+        if 'pomodoros' not in cols:
+            to_add.append(("ALTER TABLE tasks ADD COLUMN pomodoros INTEGER DEFAULT 0",))
+        if 'last_pomodoro_at' not in cols:
+            to_add.append(("ALTER TABLE tasks ADD COLUMN last_pomodoro_at TEXT",))
+
+        for (stmt,) in to_add:
+            c.execute(stmt)
+
+        # Older quick adds stored the combo text ('🔴 High', '📖 Study'); store plain values once
+        if c.execute("PRAGMA user_version").fetchone()[0] < 1:
+            c.executemany("UPDATE tasks SET priority = ? WHERE priority = ?",
+                          [(v, k) for k, v in PRIORITY_DB_MAP.items()])
+            c.executemany("UPDATE tasks SET category = ? WHERE category = ?",
+                          [(v, k) for k, v in CATEGORY_DB_MAP.items()])
+            c.execute("PRAGMA user_version = 1")
+
+        indexes = {row[0] for row in c.execute("SELECT name FROM sqlite_master WHERE type='index'").fetchall()}
+        for name, stmt in _DB_INDEXES:
+            c.execute(stmt)
+        if not {name for name, _ in _DB_INDEXES} <= indexes:
+            c.execute("ANALYZE")
+
+    ro_uri = 'file:' + pathname2url(os.path.abspath(DB_PATH)) + '?mode=ro'
+    _RO_CONN = _connect(ro_uri, uri=True)
+    _apply_pragmas(_RO_CONN)
+    _RO_CONN.create_function("py_lower", 1, str.lower)
+    # Rows index by column name, so readers don't depend on column order
+    _RO_CONN.row_factory = sqlite3.Row
 
 def backup_db():
+    """Copy the live database to BACKUP_PATH with SQLite's online backup API.
+
+    Reads through its own connection, so writers on _CONN can commit between
+    64-page steps. Returns False if the copy failed.
+    """
+    if _CONN is None:
+        return False
     try:
-        if os.path.exists(DB_PATH):
-            shutil.copyfile(DB_PATH, BACKUP_PATH)
-    except Exception:
-        pass
+        with closing(sqlite3.connect(DB_PATH)) as src, closing(sqlite3.connect(BACKUP_PATH)) as dst:
+            src.backup(dst, pages=64, sleep=0.01)
+        return True
+    except (sqlite3.Error, OSError):
+        return False
+
+class _BackupTask(QRunnable):
+    """Periodic backup off the GUI thread."""
+    def run(self):
+        backup_db()
+
+_NOW_ISO_CACHE = {'sec': -1, 'iso': ''}
+
+def _now_iso():
+    """Current local time as an ISO string, reused for writes within the same second."""
+    sec = int(time.time())
+    if sec != _NOW_ISO_CACHE['sec']:
+        _NOW_ISO_CACHE['sec'] = sec
+        _NOW_ISO_CACHE['iso'] = datetime.fromtimestamp(sec).isoformat(timespec='seconds')
+    return _NOW_ISO_CACHE['iso']
+
+# Column defaults for imported CSV rows, by position in SQL_IMPORT_TASK
+_IMPORT_DEFAULTS = ((4, None), (5, ""), (6, None), (7, None), (8, "Medium"),
+                    (9, ""), (10, "None"), (12, None))
+
+def _norm_import_row(row):
+    """SQL_IMPORT_TASK parameters for one CSV row, or None if it is malformed."""
+    row = (row + [None] * (13 - len(row)))[:13]
+    try:
+        # A missing id column lets SQLite assign one
+        if row[0] is not None:
+            row[0] = int(row[0])
+        row[3] = int(row[3] or 0)
+        row[11] = int(row[11] or 0)
+    except ValueError:
+        return None
+    for i, default in _IMPORT_DEFAULTS:
+        row[i] = row[i] or default
+    return tuple(row)
+
+def _insert_task(task, category, duedate, subtasks, priority, tags, recurring):
+    """Insert a task and return its id; sqlite3.Error propagates so a transaction can roll back."""
+    with _DB_LOCK:
+        cur = _CONN.execute(SQL_ADD_TASK,
+            (task, category, duedate, subtasks, _now_iso(), None, priority, tags, recurring))
+    return cur.lastrowid
 
 def add_task(task, category, duedate=None, subtasks="", priority="Medium", tags="", recurring="None"):
+    """Insert a task and return its id, or None on failure."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute("""INSERT INTO tasks
-            (task, category, completed, duedate, subtasks, started_at, completed_at, priority, tags, recurring, pomodoros, last_pomodoro_at)
-            VALUES (?, ?, 0, ?, ?, ?, ?, ?, ?, ?, 0, NULL)""",
-            (task, category, duedate, subtasks, datetime.now().isoformat(), None, priority, tags, recurring))
-        conn.commit()
+        return _insert_task(task, category, duedate, subtasks, priority, tags, recurring)
     except sqlite3.Error as e:
         QMessageBox.critical(None, "Database Error", f"Failed to add task: {str(e)}")
-    finally:
-        conn.close()
+        return None
 
-def get_tasks():
+def get_tasks_for_display():
+    """Task rows without last_pomodoro_at, in list order."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        # Show pending tasks first, and within each group show newest first
-        c.execute("SELECT * FROM tasks ORDER BY completed ASC, id DESC")
-        tasks = c.fetchall()
-        conn.close()
-        return tasks
+        with _RO_LOCK:
+            return _RO_CONN.execute(SQL_SELECT_DISPLAY_TASKS).fetchall()
     except sqlite3.Error as e:
         QMessageBox.critical(None, "Database Error", f"Failed to retrieve tasks: {str(e)}")
         return []
 
-def complete_task_db(task_id):
+def search_tasks_db(query):
+    """Tasks whose title or tags contain query (case-insensitive), in list order."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute("UPDATE tasks SET completed = 1, completed_at = ? WHERE id = ?", (datetime.now().isoformat(), task_id))
-        conn.commit()
+        with _RO_LOCK:
+            return _RO_CONN.execute(SQL_SEARCH_TASKS, (query.lower(),)).fetchall()
+    except sqlite3.Error as e:
+        QMessageBox.critical(None, "Database Error", f"Failed to search tasks: {str(e)}")
+        return []
+
+def get_task_by_id(task_id):
+    """One task row by primary key (display columns), or None."""
+    try:
+        with _RO_LOCK:
+            return _RO_CONN.execute(SQL_SELECT_TASK, (task_id,)).fetchone()
     except sqlite3.Error as e:
-        QMessageBox.critical(None, "Database Error", f"Failed to complete task: {str(e)}")
-    finally:
-        conn.close()
+        QMessageBox.critical(None, "Database Error", f"Failed to retrieve task: {str(e)}")
+        return None
+
+def iter_tasks():
+    """Stream task rows from the cursor instead of building a list; holds the read lock until exhausted."""
+    with _RO_LOCK:
+        yield from _RO_CONN.execute(SQL_SELECT_TASKS)
+
+def _mark_task_done(task_id):
+    """Mark a task done and return its completed_at; sqlite3.Error propagates."""
+    completed_at = _now_iso()
+    with _DB_LOCK:
+        _CONN.execute(SQL_COMPLETE_TASK, (completed_at, task_id))
+    return completed_at
 
 def delete_task_db(task_id):
+    """Delete a task; returns False if the delete failed."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        conn.commit()
+        with _DB_LOCK:
+            _CONN.execute(SQL_DELETE_TASK, (task_id,))
+        return True
     except sqlite3.Error as e:
         QMessageBox.critical(None, "Database Error", f"Failed to delete task: {str(e)}")
-    finally:
-        conn.close()
+        return False
 
 def increment_pomodoro(task_id):
     if not task_id:
         return
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute("UPDATE tasks SET pomodoros = IFNULL(pomodoros,0)+1, last_pomodoro_at = ? WHERE id = ?", (datetime.now().isoformat(), task_id))
-        conn.commit()
+        with _DB_LOCK:
+            _CONN.execute(SQL_INC_POMODORO, (_now_iso(), task_id))
     except sqlite3.Error:
         pass
-    finally:
-        conn.close()
+
+def get_task_stats():
+    """Counters for the statistics dialog; safe to call from a worker thread."""
+    today = datetime.now().date()
+    day_range = (today.isoformat(), (today + timedelta(days=1)).isoformat())
+    try:
+        with _RO_LOCK:
+            total, done, total_pomos = _RO_CONN.execute(SQL_STATS_SUMMARY).fetchone()
+            done_today = _RO_CONN.execute(SQL_STATS_DONE_TODAY, day_range).fetchone()[0]
+            latest = _RO_CONN.execute(SQL_STATS_LATEST).fetchone()
+    except sqlite3.Error:
+        total = done = done_today = total_pomos = 0
+        latest = None
+    return {'total': total, 'done': done, 'done_today': done_today,
+            'total_pomos': total_pomos, 'latest': latest}
 
 class SettingsManager:
     def __init__(self):
@@ -226,160 +467,572 @@ class SettingsManager:
 
 settings_manager = SettingsManager()
 
-def apply_global_theme(app: QApplication):
-    # Premium macOS-inspired dark theme
-    try:
-        app.setFont(QFont("SF Pro Text", 12))
-    except Exception:
-        app.setFont(QFont("Segoe UI", 12))
-
-    palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(18, 18, 22))
-    palette.setColor(QPalette.WindowText, QColor(242, 242, 247))
-    palette.setColor(QPalette.Base, QColor(20, 20, 26))
-    palette.setColor(QPalette.AlternateBase, QColor(30, 30, 36))
-    palette.setColor(QPalette.Text, QColor(235, 235, 240))
-    palette.setColor(QPalette.Button, QColor(36, 36, 44))
-    palette.setColor(QPalette.ButtonText, QColor(245, 245, 250))
-    palette.setColor(QPalette.Highlight, QColor(10, 132, 255))
-    palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ToolTipBase, QColor(50, 50, 65))
-    palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
-    palette.setColor(QPalette.PlaceholderText, QColor(180, 180, 195))
-    app.setPalette(palette)
-
-    app.setStyleSheet(
-        """
-        QWidget {
-            color: #f5f6f8;
-            font-family: -apple-system, 'SF Pro Text', 'Segoe UI', Arial, sans-serif;
-            font-size: 13px;
-        }
-
-        QToolTip {
-            background-color: rgba(40, 40, 55, 0.95);
-            color: #ffffff;
-            border: 1px solid rgba(255,255,255,0.12);
-            padding: 6px 8px;
-            border-radius: 8px;
-        }
-
-        QPushButton {
-            background: #0a84ff;
-            border: none;
-            border-radius: 14px;
-            padding: 10px 18px;
-            color: #ffffff;
-            font-weight: 600;
-            letter-spacing: 0.2px;
-            min-height: 28px;
-        }
-        QPushButton:hover { background: #0a74e6; }
-        QPushButton:pressed { background: #085fb8; }
-        QPushButton:disabled {
-            background: #3a3f55;
-            color: rgba(255,255,255,0.5);
-        }
+# Style sheets are plain constants so they are built once at import
+GLOBAL_QSS = """
+QWidget {
+    color: #f5f6f8;
+    font-family: -apple-system, 'SF Pro Text', 'Segoe UI', Arial, sans-serif;
+    font-size: 13px;
+}
+
+QToolTip {
+    background-color: rgba(40, 40, 55, 0.95);
+    color: #ffffff;
+    border: 1px solid rgba(255,255,255,0.12);
+    padding: 6px 8px;
+    border-radius: 8px;
+}
+
+QPushButton {
+    background: #0a84ff;
+    border: none;
+    border-radius: 14px;
+    padding: 10px 18px;
+    color: #ffffff;
+    font-weight: 600;
+    letter-spacing: 0.2px;
+    min-height: 28px;
+}
+QPushButton:hover { background: #0a74e6; }
+QPushButton:pressed { background: #085fb8; }
+QPushButton:disabled {
+    background: #3a3f55;
+    color: rgba(255,255,255,0.5);
+}
+
+QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox {
+    background: rgba(255, 255, 255, 0.06);
+    border: 1px solid rgba(255, 255, 255, 0.10);
+    border-radius: 12px;
+    padding: 10px 12px;
+    selection-background-color: #0a84ff;
+    selection-color: white;
+}
+QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QSpinBox:focus {
+    border: 1px solid #0a84ff;
+    background: rgba(255, 255, 255, 0.10);
+}
+
+QComboBox {
+    background: rgba(255, 255, 255, 0.06);
+    border: 1px solid rgba(255, 255, 255, 0.10);
+    border-radius: 12px;
+    padding: 8px 12px;
+    min-height: 28px;
+}
+QComboBox:hover { border: 1px solid rgba(255, 255, 255, 0.18); }
+QComboBox:focus { border: 1px solid #0a84ff; }
+QComboBox QAbstractItemView {
+    background: #24283b;
+    border: 1px solid rgba(255,255,255,0.10);
+    border-radius: 12px;
+    selection-background-color: #0a84ff;
+    color: white;
+}
+
+QListView#TaskList, QTreeView, QTableView {
+    background: rgba(255, 255, 255, 0.035);
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 14px;
+    padding: 6px;
+}
+QListView#TaskList::item {
+    background: rgba(255, 255, 255, 0.045);
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 12px;
+    margin: 4px;
+    padding: 12px;
+}
+QListView#TaskList::item:hover {
+    background: rgba(255, 255, 255, 0.09);
+}
+QListView#TaskList::item:selected {
+    background: #0a84ff;
+    border: 1px solid rgba(255,255,255,0.2);
+}
+
+QMenu {
+    background: rgba(36, 40, 59, 0.92);
+    border: 1px solid rgba(255,255,255,0.12);
+    border-radius: 10px;
+    padding: 6px;
+}
+QMenu::item {
+    padding: 8px 12px;
+    border-radius: 6px;
+}
+QMenu::item:selected { background: rgba(102,126,234,0.25); }
+QMenu::separator { height: 1px; background: rgba(255,255,255,0.08); margin: 6px 8px; }
+
+QDialog {
+    background: rgba(255,255,255,0.03);
+    color: white;
+    border: 1px solid rgba(255,255,255,0.06);
+    border-radius: 14px;
+}
+
+QScrollBar:vertical {
+    background: transparent;
+    width: 12px;
+    margin: 0px;
+}
+QScrollBar::handle:vertical {
+    background: rgba(255, 255, 255, 0.25);
+    min-height: 24px;
+    border-radius: 6px;
+}
+QScrollBar::handle:vertical:hover { background: rgba(255, 255, 255, 0.4); }
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
+"""
+
+# Main window and dialog rules, scoped by objectName so one app-level sheet serves all
+MAIN_WINDOW_QSS = """
+QMainWindow#TaskTracker {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 #14151b, stop:1 #0f1117);
+    color: #ffffff;
+}
+QWidget#TaskTracker, #TaskTracker QWidget {
+    background: transparent;
+    color: #ffffff;
+    font-family: -apple-system, 'SF Pro Text', 'Segoe UI', Arial, sans-serif;
+}
+
+/* Header and Title Styling */
+#TaskTracker QLabel#TitleLabel {
+    background: rgba(255,255,255,0.06);
+    border: 1px solid rgba(255,255,255,0.08);
+    border-radius: 14px;
+    padding: 14px 16px;
+    font-size: 18px;
+    font-weight: 700;
+    color: #f5f6f8;
+}
+
+/* Search Bar */
+#TaskTracker QLineEdit#SearchBar {
+    background: rgba(255, 255, 255, 0.08);
+    border: 1px solid rgba(255, 255, 255, 0.10);
+    border-radius: 22px;
+    padding: 12px 20px;
+    color: white;
+    font-size: 14px;
+    font-weight: 500;
+}
+#TaskTracker QLineEdit#SearchBar:focus {
+    border: 1px solid #0a84ff;
+    background: rgba(255, 255, 255, 0.12);
+}
+#TaskTracker QLineEdit#SearchBar::placeholder {
+    color: rgba(255, 255, 255, 0.6);
+}
+
+/* Quick Add Section */
+#TaskTracker QWidget#QuickAddPanel {
+    background: rgba(255, 255, 255, 0.06);
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 14px;
+    padding: 16px;
+}
+
+#TaskTracker QLineEdit#QuickAddInput {
+    background: rgba(255, 255, 255, 0.08);
+    border: 1px solid rgba(255, 255, 255, 0.10);
+    border-radius: 12px;
+    padding: 10px 15px;
+    color: white;
+    font-size: 13px;
+}
+#TaskTracker QLineEdit#QuickAddInput:focus {
+    border: 1px solid #0a84ff;
+}
+#TaskTracker QLineEdit#QuickAddInput::placeholder {
+    color: rgba(255, 255, 255, 0.5);
+}
+
+/* ComboBox Styling */
+#TaskTracker QComboBox {
+    background: rgba(255, 255, 255, 0.08);
+    border: 1px solid rgba(255, 255, 255, 0.10);
+    border-radius: 12px;
+    padding: 10px 15px;
+    color: white;
+    font-size: 13px;
+    font-weight: 500;
+    min-width: 120px;
+}
+#TaskTracker QComboBox:hover {
+    background: rgba(255, 255, 255, 0.12);
+    border: 1px solid rgba(255, 255, 255, 0.18);
+}
+#TaskTracker QComboBox:focus {
+    border: 1px solid #0a84ff;
+}
+#TaskTracker QComboBox::drop-down {
+    border: none;
+    width: 30px;
+}
+#TaskTracker QComboBox::down-arrow {
+    image: none;
+    border-left: 6px solid transparent;
+    border-right: 6px solid transparent;
+    border-top: 6px solid white;
+    margin-right: 10px;
+}
+#TaskTracker QComboBox QAbstractItemView {
+    background: #2c3e50;
+    border: 1px solid #34495e;
+    border-radius: 8px;
+    selection-background-color: #667eea;
+    color: white;
+    font-size: 13px;
+}
+
+/* Task List */
+#TaskTracker QListView#TaskList {
+    background: rgba(255, 255, 255, 0.05);
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 14px;
+    color: white;
+    font-size: 14px;
+    padding: 8px;
+    outline: none;
+}
+#TaskTracker QListView#TaskList::item {
+    background: rgba(255, 255, 255, 0.045);
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-left: 4px solid rgba(10,132,255,0.85);
+    border-radius: 12px;
+    padding: 16px 16px;
+    margin: 4px;
+    font-size: 13px;
+    line-height: 1.4;
+}
+#TaskTracker QListView#TaskList::item:hover {
+    background: rgba(255, 255, 255, 0.09);
+    border: 1px solid rgba(255, 255, 255, 0.12);
+}
+#TaskTracker QListView#TaskList::item:selected {
+    background: #0a84ff;
+    border: 1px solid rgba(255, 255, 255, 0.18);
+}
+
+/* Button Styling */
+#TaskTracker QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #0a84ff, stop:1 #0a74e6);
+    border: 1px solid rgba(255,255,255,0.08);
+    border-radius: 16px;
+    padding: 12px 20px;
+    color: #ffffff;
+    font-weight: 700;
+    font-size: 13px;
+    min-height: 20px;
+}
+#TaskTracker QPushButton:hover { background: #0a74e6; }
+#TaskTracker QPushButton:pressed { background: #085fb8; }
+#TaskTracker QPushButton:focus { border: 2px solid rgba(10,132,255,0.65); }
+
+/* Special Button Styles */
+#TaskTracker QPushButton#QuickAddBtn { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #34c759, stop:1 #2fb14f); }
+#TaskTracker QPushButton#QuickAddBtn:hover { background: #2fb14f; }
+
+#TaskTracker QPushButton#PomodoroBtn { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff9f0a, stop:1 #e28c09); font-size: 16px; padding: 15px 30px; border-radius: 18px; }
+#TaskTracker QPushButton#PomodoroBtn:hover { background: #e28c09; }
+
+#TaskTracker QPushButton#CompleteBtn { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #34c759, stop:1 #2fb14f); }
+#TaskTracker QPushButton#CompleteBtn:hover { background: #2fb14f; }
+
+#TaskTracker QPushButton#DeleteBtn { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff453a, stop:1 #e03d33); }
+#TaskTracker QPushButton#DeleteBtn:hover { background: #e03d33; }
+
+/* Scrollbar Styling */
+#TaskTracker QScrollBar:vertical {
+    background: rgba(255, 255, 255, 0.1);
+    width: 12px;
+    border-radius: 6px;
+}
+#TaskTracker QScrollBar::handle:vertical {
+    background: rgba(255, 255, 255, 0.3);
+    border-radius: 6px;
+    min-height: 20px;
+}
+#TaskTracker QScrollBar::handle:vertical:hover {
+    background: rgba(255, 255, 255, 0.5);
+}
+#TaskTracker QScrollBar::add-line:vertical, #TaskTracker QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+
+/* Panel Styling */
+#TaskTracker QWidget#LeftPanel {
+    background: rgba(255, 255, 255, 0.05);
+    border: 1px solid rgba(255, 255, 255, 0.06);
+    border-radius: 14px;
+    padding: 16px;
+}
+
+#TaskTracker QWidget#RightPanel {
+    background: rgba(255, 255, 255, 0.04);
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 14px;
+    padding: 16px;
+}
+"""
+
+SETTINGS_DIALOG_QSS = """
+QDialog#SettingsDialog {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 #1a1a2e, stop:1 #16213e);
+    color: white;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+#SettingsDialog QLabel {
+    color: white;
+    font-size: 13px;
+    font-weight: 500;
+}
+
+#SettingsDialog QLabel#SectionTitle {
+    font-size: 16px;
+    font-weight: bold;
+    color: #667eea;
+    padding: 10px 0;
+    border-bottom: 2px solid rgba(102, 126, 234, 0.3);
+}
+
+#SettingsDialog QLabel#StudyTimeDisplay {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #2ecc71, stop:1 #27ae60);
+    border-radius: 10px;
+    padding: 15px;
+    font-size: 18px;
+    font-weight: bold;
+    color: white;
+    text-align: center;
+}
+
+#SettingsDialog QSpinBox {
+    background: rgba(255, 255, 255, 0.1);
+    border: 2px solid rgba(255, 255, 255, 0.2);
+    border-radius: 8px;
+    padding: 10px 15px;
+    color: white;
+    font-size: 14px;
+    font-weight: 500;
+    min-width: 100px;
+}
+#SettingsDialog QSpinBox:hover {
+    border: 2px solid rgba(255, 255, 255, 0.3);
+}
+#SettingsDialog QSpinBox:focus {
+    border: 2px solid #667eea;
+    background: rgba(255, 255, 255, 0.15);
+}
+#SettingsDialog QSpinBox::up-button, #SettingsDialog QSpinBox::down-button {
+    background: rgba(255, 255, 255, 0.1);
+    border: none;
+    border-radius: 4px;
+    width: 20px;
+    height: 15px;
+}
+#SettingsDialog QSpinBox::up-button:hover, #SettingsDialog QSpinBox::down-button:hover {
+    background: rgba(255, 255, 255, 0.2);
+}
+#SettingsDialog QSpinBox::up-arrow {
+    image: none;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-bottom: 6px solid white;
+}
+#SettingsDialog QSpinBox::down-arrow {
+    image: none;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 6px solid white;
+}
+
+#SettingsDialog QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #667eea, stop:1 #764ba2);
+    border: none;
+    border-radius: 8px;
+    padding: 12px 24px;
+    color: white;
+    font-weight: bold;
+    font-size: 14px;
+    min-width: 100px;
+}
+#SettingsDialog QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #5a6fd8, stop:1 #6a4190);
+}
+#SettingsDialog QPushButton:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #4a5fc8, stop:1 #5a3180);
+}
+
+/* The main window's focus ring does not apply to dialog buttons */
+#SettingsDialog QPushButton:focus { border: none; }
+
+#SettingsDialog QPushButton[cancel="true"] {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #e74c3c, stop:1 #c0392b);
+}
+#SettingsDialog QPushButton[cancel="true"]:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #c0392b, stop:1 #a93226);
+}
+"""
+
+STATS_DIALOG_QSS = """
+QDialog#StatsDialog {
+    background-color: #2c3e50;
+    color: white;
+}
+#StatsDialog QLabel {
+    color: white;
+    font-size: 12px;
+}
+#StatsDialog QPushButton {
+    background-color: #3498db;
+    border: none;
+    border-radius: 4px;
+    padding: 8px 16px;
+    color: white;
+    font-weight: bold;
+}
+#StatsDialog QPushButton:hover {
+    background-color: #2980b9;
+}
+#StatsDialog QPushButton:focus { border: none; }
+"""
+
+# Parsed by Qt once, when apply_global_theme() installs it on the application
+APP_QSS = GLOBAL_QSS + MAIN_WINDOW_QSS + SETTINGS_DIALOG_QSS + STATS_DIALOG_QSS
+
+FLOATING_PANEL_QSS = """
+QWidget#FloatingPanel {
+    background: rgba(25, 25, 32, 0.72);
+    border: 1px solid rgba(255, 255, 255, 0.10);
+    border-radius: 18px;
+}
+QLabel {
+    color: #f5f6f8;
+    font-family: -apple-system, 'SF Pro Text', 'Segoe UI', Arial, sans-serif;
+}
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #0a84ff, stop:1 #0a74e6);
+    border: none;
+    color: white;
+    padding: 8px 14px;
+    border-radius: 14px;
+    font-weight: 600;
+    font-size: 14px;
+}
+QPushButton:hover { background: #0a74e6; }
+QPushButton:pressed { background: #085fb8; }
+QPushButton#StartBtn {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #34c759, stop:1 #2fb14f);
+}
+QPushButton#StartBtn:hover { background: #2fb14f; }
+QPushButton#StartBtn:pressed { background: #279745; }
+QPushButton#ResetBtn { background: #3a3a44; color: #e6e7ea; }
+QPushButton#ResetBtn:hover { background: #464654; }
+QPushButton#ResetBtn:pressed { background: #3b3b48; }
+QPushButton#CloseButton {
+    background: rgba(255,255,255,0.08);
+    color: #cfd2d8;
+    border-radius: 12px;
+    padding: 0px;
+    font-size: 13px;
+    min-width: 24px;
+    min-height: 24px;
+}
+QPushButton#CloseButton:hover { background: rgba(255, 59, 48, 0.9); color: #ffffff; }
+QPushButton#CloseButton:pressed { background: rgba(220, 30, 20, 0.95); }
+"""
+
+# Theme font and palette, built on first use and shared afterwards
+_APP_FONT = None
+_PALETTE = None
+_APP_ICON = None
+
+def _get_app_font():
+    global _APP_FONT
+    if _APP_FONT is None:
+        try:
+            _APP_FONT = QFont("SF Pro Text", 12)
+        except Exception:
+            _APP_FONT = QFont("Segoe UI", 12)
+    return _APP_FONT
 
-        QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox {
-            background: rgba(255, 255, 255, 0.06);
-            border: 1px solid rgba(255, 255, 255, 0.10);
-            border-radius: 12px;
-            padding: 10px 12px;
-            selection-background-color: #0a84ff;
-            selection-color: white;
-        }
-        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QSpinBox:focus {
-            border: 1px solid #0a84ff;
-            background: rgba(255, 255, 255, 0.10);
-        }
+def get_app_icon():
+    """Bundled study.ico, decoded once; falls back to the theme icon."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon = QIcon(resource_path('study.ico'))
+        _APP_ICON = icon if not icon.isNull() else QIcon.fromTheme("face-smile")
+    return _APP_ICON
+
+def _get_palette():
+    global _PALETTE
+    if _PALETTE is None:
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor(18, 18, 22))
+        palette.setColor(QPalette.WindowText, QColor(242, 242, 247))
+        palette.setColor(QPalette.Base, QColor(20, 20, 26))
+        palette.setColor(QPalette.AlternateBase, QColor(30, 30, 36))
+        palette.setColor(QPalette.Text, QColor(235, 235, 240))
+        palette.setColor(QPalette.Button, QColor(36, 36, 44))
+        palette.setColor(QPalette.ButtonText, QColor(245, 245, 250))
+        palette.setColor(QPalette.Highlight, QColor(10, 132, 255))
+        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
+        palette.setColor(QPalette.ToolTipBase, QColor(50, 50, 65))
+        palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
+        palette.setColor(QPalette.PlaceholderText, QColor(180, 180, 195))
+        _PALETTE = palette
+    return _PALETTE
 
-        QComboBox {
-            background: rgba(255, 255, 255, 0.06);
-            border: 1px solid rgba(255, 255, 255, 0.10);
-            border-radius: 12px;
-            padding: 8px 12px;
-            min-height: 28px;
-        }
-        QComboBox:hover { border: 1px solid rgba(255, 255, 255, 0.18); }
-        QComboBox:focus { border: 1px solid #0a84ff; }
-        QComboBox QAbstractItemView {
-            background: #24283b;
-            border: 1px solid rgba(255,255,255,0.10);
-            border-radius: 12px;
-            selection-background-color: #0a84ff;
-            color: white;
-        }
+def apply_global_theme(app: QApplication):
+    # Premium macOS-inspired dark theme
+    app.setFont(_get_app_font())
+    app.setPalette(_get_palette())
 
-        QListWidget, QTreeView, QTableView {
-            background: rgba(255, 255, 255, 0.035);
-            border: 1px solid rgba(255, 255, 255, 0.08);
-            border-radius: 14px;
-            padding: 6px;
-        }
-        QListWidget::item {
-            background: rgba(255, 255, 255, 0.045);
-            border: 1px solid rgba(255, 255, 255, 0.08);
-            border-radius: 12px;
-            margin: 4px;
-            padding: 12px;
-        }
-        QListWidget::item:hover {
-            background: rgba(255, 255, 255, 0.09);
-        }
-        QListWidget::item:selected {
-            background: #0a84ff;
-            border: 1px solid rgba(255,255,255,0.2);
-        }
+    app.setStyleSheet(APP_QSS)
 
-        QMenu {
-            background: rgba(36, 40, 59, 0.92);
-            border: 1px solid rgba(255,255,255,0.12);
-            border-radius: 10px;
-            padding: 6px;
-        }
-        QMenu::item {
-            padding: 8px 12px;
-            border-radius: 6px;
-        }
-        QMenu::item:selected { background: rgba(102,126,234,0.25); }
-        QMenu::separator { height: 1px; background: rgba(255,255,255,0.08); margin: 6px 8px; }
-
-        QDialog {
-            background: rgba(255,255,255,0.03);
-            color: white;
-            border: 1px solid rgba(255,255,255,0.06);
-            border-radius: 14px;
-        }
+# Notification player and sound file lookup, created on first use
+_PLAYER = None
+_SOUND_FILES = None
 
-        QScrollBar:vertical {
-            background: transparent;
-            width: 12px;
-            margin: 0px;
-        }
-        QScrollBar::handle:vertical {
-            background: rgba(255, 255, 255, 0.25);
-            min-height: 24px;
-            border-radius: 6px;
-        }
-        QScrollBar::handle:vertical:hover { background: rgba(255, 255, 255, 0.4); }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
-        """
-    )
+def _sound_files():
+    """Return (mp3_path, wav_path), with None for files that are missing."""
+    global _SOUND_FILES
+    if _SOUND_FILES is None:
+        mp3_path = resource_path(os.path.join('sounds', 'notify.mp3'))
+        wav_path = resource_path(os.path.join('sounds', 'notify.wav'))
+        _SOUND_FILES = (mp3_path if os.path.exists(mp3_path) else None,
+                        wav_path if os.path.exists(wav_path) else None)
+    return _SOUND_FILES
 
 def play_notification_sound():
-    mp3_path = resource_path(os.path.join('sounds', 'notify.mp3'))
-    wav_path = resource_path(os.path.join('sounds', 'notify.wav'))
+    global _PLAYER
+    mp3_path, wav_path = _sound_files()
     try:
-        if os.path.exists(mp3_path):
-            player = QMediaPlayer()
-            media = QMediaContent(QUrl.fromLocalFile(mp3_path))
-            player.setMedia(media)
-            player.setVolume(70)
-            player.play()
-            QApplication.instance()._last_media_player = player  # keep ref
+        if mp3_path:
+            if _PLAYER is None:
+                _PLAYER = QMediaPlayer()
+                _PLAYER.setVolume(70)
+                _PLAYER.setMedia(QMediaContent(QUrl.fromLocalFile(mp3_path)))
+            else:
+                _PLAYER.stop()
+                _PLAYER.setPosition(0)
+            _PLAYER.play()
             return
-        if os.path.exists(wav_path):
+        if wav_path:
             QSound.play(wav_path)
             return
     except Exception:
@@ -393,7 +1046,12 @@ class PomodoroManager:
     """
     Handles cycle logic and emits callbacks for UI to update.
     Phases: 'Focus', 'Short Break', 'Long Break'
+
+    The countdown is anchored to a monotonic deadline; the timer only polls it,
+    so a late tick never makes the session drift.
     """
+    TICK_MS = 100
+
     def __init__(self, on_phase_change=None, on_tick=None, on_complete_cycle=None):
         self.on_phase_change = on_phase_change
         self.on_tick = on_tick
@@ -407,75 +1065,55 @@ class PomodoroManager:
         self.is_running = False
         self.completed_focus_count = 0  # since last long break
         self.attached_task_id = None
-        self.session_start_time = None
-        self.total_session_time = 0  # seconds completed in this session
+        self._focus_elapsed = 0  # focus seconds ticked but not yet added to study time
+        self._end_ns = 0  # monotonic deadline of the running phase
 
     def attach_task(self, task_id: int):
         self.attached_task_id = task_id
 
+    def _commit_focus_time(self):
+        if self._focus_elapsed > 0:
+            add_study_time(self._focus_elapsed)
+            self._focus_elapsed = 0
+
     def save_current_session(self):
         """Save current session time immediately"""
-        if self.phase == 'Focus' and self.session_start_time:
-            elapsed = datetime.now() - self.session_start_time
-            self.total_session_time += elapsed.total_seconds()
-            self.session_start_time = None
-            if self.total_session_time > 0:
-                add_study_time(int(self.total_session_time))
-                self.total_session_time = 0
+        self._commit_focus_time()
 
     def start(self):
         if not self.is_running:
             if self.remaining <= 0:
                 self._reset_phase_duration()
-            self.timer.start(1000)
+            self._arm()
+            self.timer.start(self.TICK_MS)
             self.is_running = True
-            if self.phase == 'Focus' and not self.session_start_time:
-                self.session_start_time = datetime.now()
+
+    def _arm(self):
+        self._end_ns = time.monotonic_ns() + self.remaining * 1_000_000_000
 
     def pause(self):
         if self.is_running:
             self.timer.stop()
             self.is_running = False
-            if self.phase == 'Focus' and self.session_start_time:
-                elapsed = datetime.now() - self.session_start_time
-                self.total_session_time += elapsed.total_seconds()
-                self.session_start_time = None
-                if self.total_session_time > 0:
-                    add_study_time(int(self.total_session_time))
-                    self.total_session_time = 0
+            self._commit_focus_time()
 
     def reset(self):
-        if self.phase == 'Focus' and self.session_start_time:
-            elapsed = datetime.now() - self.session_start_time
-            self.total_session_time += elapsed.total_seconds()
-            self.session_start_time = None
-
-        if self.total_session_time > 0:
-            add_study_time(int(self.total_session_time))
-            self.total_session_time = 0
-
+        self._commit_focus_time()
         self.pause()
         self.phase = 'Focus'
         self.remaining = settings_manager.get_focus()
         self._notify_phase_change()
 
     def switch_phase(self, phase: str):
-        if self.phase == 'Focus' and self.session_start_time:
-            elapsed = datetime.now() - self.session_start_time
-            self.total_session_time += elapsed.total_seconds()
-            self.session_start_time = None
-            if self.total_session_time > 0:
-                add_study_time(int(self.total_session_time))
-                self.total_session_time = 0
+        self._commit_focus_time()
 
         self.phase = phase
         self._reset_phase_duration()
         self._notify_phase_change()
 
         if self.is_running:
-            self.timer.start(1000)
-            if self.phase == 'Focus':
-                self.session_start_time = datetime.now()
+            self._arm()
+            self.timer.start(self.TICK_MS)
 
     def _reset_phase_duration(self):
         if self.phase == 'Focus':
@@ -493,24 +1131,26 @@ class PomodoroManager:
         if self.remaining <= 0:
             self._handle_phase_end()
             return
-        self.remaining -= 1
+        # Whole seconds left, rounded up like a countdown display
+        left = max(0, -((time.monotonic_ns() - self._end_ns) // 1_000_000_000))
+        if left >= self.remaining:
+            return
+        if self.phase == 'Focus' and self.is_running:
+            self._focus_elapsed += self.remaining - left
+        self.remaining = left
         if self.on_tick:
             self.on_tick(self.phase, self.remaining, self._format(self.remaining))
 
     def _handle_phase_end(self):
-        play_notification_sound()
+        # Start the sound once this handler's writes are done
+        QTimer.singleShot(0, play_notification_sound)
 
         if self.phase == 'Focus':
             self.completed_focus_count += 1
-            if self.attached_task_id:
-                increment_pomodoro(self.attached_task_id)
-
-            if self.session_start_time:
-                elapsed = datetime.now() - self.session_start_time
-                self.total_session_time += elapsed.total_seconds()
-                self.session_start_time = None
-                add_study_time(int(self.total_session_time))
-                self.total_session_time = 0
+            # Persist the pomodoro and the session's study time back to back
+            increment_pomodoro(self.attached_task_id)
+            self._commit_focus_time()
+            flush_study_time()
 
         if self.phase == 'Focus':
             if self.completed_focus_count % settings_manager.get_every() == 0:
@@ -521,6 +1161,8 @@ class PomodoroManager:
             self.phase = 'Focus'
 
         self._reset_phase_duration()
+        if self.is_running:
+            self._arm()
         self._notify_phase_change()
 
         if self.on_complete_cycle:
@@ -531,6 +1173,12 @@ class PomodoroManager:
             self.on_phase_change(self.phase, self.remaining, self._format(self.remaining))
 
 class FloatingPomodoroWidget(QWidget):
+    _LABEL_STYLES = {
+        phase: f"font-size: 22px; font-weight: 600; color: {color};"
+        for phase, color in (('Focus', '#58D68D'), ('Short Break', '#5DADE2'), ('Long Break', '#AF7AC5'))
+    }
+    _LABEL_STYLE_DEFAULT = "font-size: 22px; font-weight: 600; color: white;"
+
     def __init__(self, parent=None, manager=None):
         super().__init__(None)
         self._owner = parent
@@ -539,6 +1187,9 @@ class FloatingPomodoroWidget(QWidget):
         self.setWindowTitle("Pomodoro Timer")
 
         self.attached_task_title = None
+        self._last_phase = None
+        self._last_label_text = None
+        self._last_study_secs = None
 
         self.manager = manager or PomodoroManager()
 
@@ -546,54 +1197,17 @@ class FloatingPomodoroWidget(QWidget):
         self._moved = False
         self._press_pos = None
 
-        self.setStyleSheet(
-            """
-            QWidget#FloatingPanel {
-                background: rgba(25, 25, 32, 0.72);
-                border: 1px solid rgba(255, 255, 255, 0.10);
-                border-radius: 18px;
-            }
-            QLabel {
-                color: #f5f6f8;
-                font-family: -apple-system, 'SF Pro Text', 'Segoe UI', Arial, sans-serif;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #0a84ff, stop:1 #0a74e6);
-                border: none;
-                color: white;
-                padding: 8px 14px;
-                border-radius: 14px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QPushButton:hover { background: #0a74e6; }
-            QPushButton:pressed { background: #085fb8; }
-            QPushButton#StartBtn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #34c759, stop:1 #2fb14f);
-            }
-            QPushButton#StartBtn:hover { background: #2fb14f; }
-            QPushButton#StartBtn:pressed { background: #279745; }
-            QPushButton#ResetBtn { background: #3a3a44; color: #e6e7ea; }
-            QPushButton#ResetBtn:hover { background: #464654; }
-            QPushButton#ResetBtn:pressed { background: #3b3b48; }
-            QPushButton#CloseButton {
-                background: rgba(255,255,255,0.08);
-                color: #cfd2d8;
-                border-radius: 12px;
-                padding: 0px;
-                font-size: 13px;
-                min-width: 24px;
-                min-height: 24px;
-            }
-            QPushButton#CloseButton:hover { background: rgba(255, 59, 48, 0.9); color: #ffffff; }
-            QPushButton#CloseButton:pressed { background: rgba(220, 30, 20, 0.95); }
-            """
-        )
+        # Drag moves are accumulated and applied at most once per frame
+        self._pending_delta = QPoint(0, 0)
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._apply_drag)
 
         panel = QWidget(self)
         panel.setObjectName("FloatingPanel")
+        # Scoped to the panel so only its subtree matches these selectors
+        panel.setStyleSheet(FLOATING_PANEL_QSS)
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(12)
@@ -651,11 +1265,11 @@ class FloatingPomodoroWidget(QWidget):
         outer.addWidget(panel)
         self.setLayout(outer)
 
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(24)
-        shadow.setOffset(0, 6)
-        shadow.setColor(Qt.black)
-        panel.setGraphicsEffect(shadow)
+        self._shadow = QGraphicsDropShadowEffect(self)
+        self._shadow.setBlurRadius(24)
+        self._shadow.setOffset(0, 6)
+        self._shadow.setColor(Qt.black)
+        panel.setGraphicsEffect(self._shadow)
 
         self.menu = QMenu(self)
         act_toggle = QAction("Start/Pause", self, triggered=self._toggle)
@@ -672,6 +1286,7 @@ class FloatingPomodoroWidget(QWidget):
 
         self.manager.on_tick = self._on_tick
         self.manager.on_phase_change = self._on_phase_change
+        self.manager.on_complete_cycle = self._on_cycle
 
         self._on_phase_change(self.manager.phase, self.manager.remaining, self._format(self.manager.remaining))
 
@@ -684,28 +1299,38 @@ class FloatingPomodoroWidget(QWidget):
             return f"{phase} {mmss} · {self.attached_task_title}"
         return f"{phase} {mmss}"
 
+    def _set_label_text(self, text):
+        # setText relayouts and repaints even when the text is unchanged
+        if text != self._last_label_text:
+            self.label.setText(text)
+            self._last_label_text = text
+
+    def _show_study_time(self):
+        # The total only moves when focus time is committed, so format on change
+        secs = load_study_time()
+        if secs != self._last_study_secs:
+            self.study_time_label.setText(f"Study Time: {format_study_time(secs)}")
+            self._last_study_secs = secs
+
     def _on_phase_change(self, phase, remaining, mmss):
-        color_map = {
-            'Focus': '#58D68D',
-            'Short Break': '#5DADE2',
-            'Long Break': '#AF7AC5'
-        }
-        color = color_map.get(phase, 'white')
-        self.label.setText(self._title_text(phase, mmss))
-        self.label.setStyleSheet(f"font-size: 22px; font-weight: 600; color: {color};")
+        self._set_label_text(self._title_text(phase, mmss))
+        if phase != self._last_phase:
+            self.label.setStyleSheet(self._LABEL_STYLES.get(phase, self._LABEL_STYLE_DEFAULT))
+            self._last_phase = phase
 
-        total_study = load_study_time()
-        self.study_time_label.setText(f"Study Time: {format_study_time(total_study)}")
+        self._show_study_time()
 
     def _on_tick(self, phase, remaining, mmss):
-        self.label.setText(self._title_text(phase, mmss))
+        self._set_label_text(self._title_text(phase, mmss))
 
         if phase == 'Focus' and self.manager.is_running:
-            total_study = load_study_time()
-            self.study_time_label.setText(f"Study Time: {format_study_time(total_study)}")
+            self._show_study_time()
 
     def _on_cycle(self, next_phase):
-        pass
+        # A finished focus phase bumps the attached task's pomodoro count
+        task_id = self.manager.attached_task_id
+        if next_phase != 'Focus' and task_id is not None and isinstance(self._owner, TaskTracker):
+            self._owner.refresh_task(task_id)
 
     def _start(self):
         self.manager.start()
@@ -757,17 +1382,31 @@ class FloatingPomodoroWidget(QWidget):
         if self._pressed and self._press_pos:
             delta = event.globalPos() - self._press_pos
             if delta.manhattanLength() > 6:
-                self._moved = True
-                self.move(self.x() + delta.x(), self.y() + delta.y())
+                if not self._moved:
+                    self._moved = True
+                    # The blurred shadow is costly to recomposite while moving
+                    self._shadow.setEnabled(False)
+                self._pending_delta += delta
                 self._press_pos = event.globalPos()
+                if not self._drag_timer.isActive():
+                    self._drag_timer.start()
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
+    def _apply_drag(self):
+        if not self._pending_delta.isNull():
+            self.move(self.pos() + self._pending_delta)
+            self._pending_delta = QPoint(0, 0)
+
     def mouseReleaseEvent(self, event):
         if self._pressed and event.button() == Qt.LeftButton:
             self._pressed = False
-            if not self._moved:
+            if self._moved:
+                self._drag_timer.stop()
+                self._apply_drag()
+                self._shadow.setEnabled(True)
+            else:
                 if self.manager.is_running:
                     self._pause()
                 else:
@@ -784,115 +1423,23 @@ class FloatingPomodoroWidget(QWidget):
     def closeEvent(self, event):
         if self.manager:
             self.manager.save_current_session()
+        flush_study_time()
         event.accept()
 
 class SettingsDialog(QDialog):
+    # (attribute, row label, maximum, settings getter, divisor, suffix)
+    _SPINBOXES = (
+        ('focus_m', 'Focus Duration:', 300, 'get_focus', 60, " minutes"),
+        ('short_m', 'Short Break:', 120, 'get_short', 60, " minutes"),
+        ('long_m', 'Long Break:', 240, 'get_long', 60, " minutes"),
+        ('every_n', 'Long Break Every:', 12, 'get_every', 1, " sessions"),
+    )
+
     def __init__(self, parent=None):
         super(SettingsDialog, self).__init__(parent)
+        self.setObjectName("SettingsDialog")
         self.setWindowTitle('Routine  - Settings')
         self.setMinimumSize(500, 400)
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #1a1a2e, stop:1 #16213e);
-                color: white;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-
-            QLabel {
-                color: white;
-                font-size: 13px;
-                font-weight: 500;
-            }
-
-            QLabel#SectionTitle {
-                font-size: 16px;
-                font-weight: bold;
-                color: #667eea;
-                padding: 10px 0;
-                border-bottom: 2px solid rgba(102, 126, 234, 0.3);
-            }
-
-            QLabel#StudyTimeDisplay {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2ecc71, stop:1 #27ae60);
-                border-radius: 10px;
-                padding: 15px;
-                font-size: 18px;
-                font-weight: bold;
-                color: white;
-                text-align: center;
-            }
-
-            QSpinBox {
-                background: rgba(255, 255, 255, 0.1);
-                border: 2px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                padding: 10px 15px;
-                color: white;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 100px;
-            }
-            QSpinBox:hover {
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            QSpinBox:focus {
-                border: 2px solid #667eea;
-                background: rgba(255, 255, 255, 0.15);
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 4px;
-                width: 20px;
-                height: 15px;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background: rgba(255, 255, 255, 0.2);
-            }
-            QSpinBox::up-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-bottom: 6px solid white;
-            }
-            QSpinBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid white;
-            }
-
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #5a6fd8, stop:1 #6a4190);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4a5fc8, stop:1 #5a3180);
-            }
-
-            QPushButton#CancelBtn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #e74c3c, stop:1 #c0392b);
-            }
-            QPushButton#CancelBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #c0392b, stop:1 #a93226);
-            }
-        """)
 
         self.form = QVBoxLayout(self)
         self.form.setSpacing(20)
@@ -919,30 +1466,13 @@ class SettingsDialog(QDialog):
         settings_layout.setSpacing(15)
         settings_layout.setLabelAlignment(Qt.AlignRight)
 
-        self.focus_m = QSpinBox(self)
-        self.focus_m.setRange(1, 300)
-        self.focus_m.setValue(settings_manager.get_focus() // 60)
-        self.focus_m.setSuffix(" minutes")
-
-        self.short_m = QSpinBox(self)
-        self.short_m.setRange(1, 120)
-        self.short_m.setValue(settings_manager.get_short() // 60)
-        self.short_m.setSuffix(" minutes")
-
-        self.long_m = QSpinBox(self)
-        self.long_m.setRange(1, 240)
-        self.long_m.setValue(settings_manager.get_long() // 60)
-        self.long_m.setSuffix(" minutes")
-
-        self.every_n = QSpinBox(self)
-        self.every_n.setRange(1, 12)
-        self.every_n.setValue(settings_manager.get_every())
-        self.every_n.setSuffix(" sessions")
-
-        settings_layout.addRow('Focus Duration:', self.focus_m)
-        settings_layout.addRow('Short Break:', self.short_m)
-        settings_layout.addRow('Long Break:', self.long_m)
-        settings_layout.addRow('Long Break Every:', self.every_n)
+        for attr, label, maximum, getter, divisor, suffix in self._SPINBOXES:
+            spin = QSpinBox(self)
+            spin.setRange(1, maximum)
+            spin.setValue(getattr(settings_manager, getter)() // divisor)
+            spin.setSuffix(suffix)
+            setattr(self, attr, spin)
+            settings_layout.addRow(label, spin)
 
         self.form.addWidget(settings_widget)
 
@@ -953,9 +1483,12 @@ class SettingsDialog(QDialog):
         self.button_box.accepted.connect(self.accept)
         self.button_box.rejected.connect(self.reject)
 
-        for button in self.button_box.buttons():
-            if self.button_box.buttonRole(button) == QDialogButtonBox.RejectRole:
-                button.setObjectName("CancelBtn")
+        # Styled by the QPushButton[cancel="true"] rule in the app style sheet. The
+        # button was already polished when the box created it, so re-polish once.
+        cancel_btn = self.button_box.button(QDialogButtonBox.Cancel)
+        cancel_btn.setProperty("cancel", True)
+        cancel_btn.style().unpolish(cancel_btn)
+        cancel_btn.style().polish(cancel_btn)
 
         button_layout.addStretch()
         button_layout.addWidget(self.button_box)
@@ -983,61 +1516,8 @@ class HelpDialog(QDialog):
         text.setWordWrap(True)
         layout.addWidget(text)
 
-class StatsDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle('Statistics')
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2c3e50;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                font-size: 12px;
-            }
-            QPushButton {
-                background-color: #3498db;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-
-        layout = QVBoxLayout(self)
-        self.info = QLabel("", self)
-        self.info.setWordWrap(True)
-        self.info.setStyleSheet("font-size: 13px; line-height: 1.5; padding: 15px; background-color: #34495e; border-radius: 8px;")
-        layout.addWidget(self.info)
-
-        try:
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            total = c.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
-            done = c.execute("SELECT COUNT(*) FROM tasks WHERE completed=1").fetchone()[0]
-            today = datetime.now().date().isoformat()
-            done_today = c.execute(
-                "SELECT COUNT(*) FROM tasks WHERE completed=1 AND date(substr(completed_at,1,10))=?",
-                (today,)
-            ).fetchone()[0]
-            total_pomos = c.execute("SELECT SUM(pomodoros) FROM tasks").fetchone()[0] or 0
-            latest = c.execute("SELECT task, pomodoros FROM tasks ORDER BY last_pomodoro_at DESC LIMIT 1").fetchone()
-            conn.close()
-        except Exception:
-            total = done = done_today = total_pomos = 0
-            latest = None
-
-        total_study_time = load_study_time()
-        study_time_formatted = format_study_time(total_study_time)
-
-        latest_txt = f"{latest[0]} (+{latest[1]} total)" if latest else "—"
-
-        stats_text = f"""
+# Statistics body; only the fields are filled in per open
+_STATS_TMPL = """
 📊 <b>Task Statistics:</b>
 • Total tasks: <span style='color: #3498db;'>{total}</span>
 • Completed tasks: <span style='color: #2ecc71;'>{done}</span>
@@ -1049,11 +1529,57 @@ class StatsDialog(QDialog):
 • Total study time: <span style='color: #2ecc71; font-size: 16px; font-weight: bold;'>{study_time_formatted}</span>
         """
 
-        self.info.setText(stats_text)
+class _StatsSignals(QObject):
+    loaded = pyqtSignal(dict)
+
+class _StatsLoader(QRunnable):
+    def __init__(self):
+        super().__init__()
+        self.signals = _StatsSignals()
+
+    def run(self):
+        self.signals.loaded.emit(get_task_stats())
+
+class StatsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("StatsDialog")
+        self.setWindowTitle('Statistics')
+
+        layout = QVBoxLayout(self)
+        self.info = QLabel("", self)
+        self.info.setWordWrap(True)
+        self.info.setStyleSheet("font-size: 13px; line-height: 1.5; padding: 15px; background-color: #34495e; border-radius: 8px;")
+        layout.addWidget(self.info)
+        # Placeholder until the worker reports back
+        self._show_stats({'total': "…", 'done': "…", 'done_today': "…", 'total_pomos': "…", 'latest': None})
 
         btns = QDialogButtonBox(QDialogButtonBox.Ok)
         btns.accepted.connect(self.accept)
         layout.addWidget(btns)
+        self.refresh()
+
+    def refresh(self):
+        # Query on the thread pool; the queued signal lands back on the GUI thread
+        loader = _StatsLoader()
+        loader.signals.loaded.connect(self._show_stats, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(loader)
+
+    def _show_stats(self, stats):
+        latest = stats['latest']
+        latest_txt = f"{latest['task']} (+{latest['pomodoros']} total)" if latest else "—"
+        self.info.setText(_STATS_TMPL.format(
+            total=stats['total'], done=stats['done'], done_today=stats['done_today'],
+            total_pomos=stats['total_pomos'], latest_txt=latest_txt,
+            study_time_formatted=format_study_time(load_study_time())))
+        self.adjustSize()
+
+def _combo_index(choices, db_map, value):
+    """Position in choices of the entry stored as value; 0 if unknown."""
+    for i, text in enumerate(choices):
+        if db_map[text] == value:
+            return i
+    return 0
 
 class TaskDialog(QDialog):
     def __init__(self, parent=None):
@@ -1066,11 +1592,11 @@ class TaskDialog(QDialog):
         self.form.addRow('Task Title:', self.task_title_edit)
 
         self.category_combobox = QComboBox(self)
-        self.category_combobox.addItems(['Study', 'Homework'])
+        self.category_combobox.addItems(CATEGORIES)
         self.form.addRow('Category:', self.category_combobox)
 
         self.priority_combo = QComboBox(self)
-        self.priority_combo.addItems(['High', 'Medium', 'Low'])
+        self.priority_combo.addItems(PRIORITIES)
         self.form.addRow('Priority:', self.priority_combo)
 
         self.tags_edit = QLineEdit(self)
@@ -1099,239 +1625,279 @@ class TaskDialog(QDialog):
     def get_task_details(self):
         return {
             'title': self.task_title_edit.text().strip(),
-            'category': self.category_combobox.currentText(),
-            'priority': self.priority_combo.currentText(),
+            'category': CATEGORY_DB_MAP[self.category_combobox.currentText()],
+            'priority': PRIORITY_DB_MAP[self.priority_combo.currentText()],
             'tags': self.tags_edit.text().strip(),
             'recurring': self.recurring_combo.currentText(),
             'duedate': self.duedate_edit.dateTime().toString(Qt.ISODate),
             'subtasks': self.subtasks_edit.text().strip()
         }
 
+    def reset(self):
+        """Back to the state of a freshly built dialog, for reuse."""
+        self.task_title_edit.clear()
+        self.category_combobox.setCurrentIndex(0)
+        self.priority_combo.setCurrentIndex(0)
+        self.tags_edit.clear()
+        self.recurring_combo.setCurrentIndex(0)
+        self.duedate_edit.setDateTime(QDateTime.currentDateTime())
+        self.subtasks_edit.clear()
+        self.task_title_edit.setFocus()
+
     def set_task_details(self, details):
         self.task_title_edit.setText(details.get('title', ''))
-        self.category_combobox.setCurrentText(details.get('category', 'Study'))
-        self.priority_combo.setCurrentText(details.get('priority', 'Medium'))
+        self.category_combobox.setCurrentIndex(_combo_index(CATEGORIES, CATEGORY_DB_MAP, details.get('category', 'Study')))
+        self.priority_combo.setCurrentIndex(_combo_index(PRIORITIES, PRIORITY_DB_MAP, details.get('priority', 'Medium')))
         self.tags_edit.setText(details.get('tags', ''))
         self.recurring_combo.setCurrentText(details.get('recurring', 'None'))
         if details.get('duedate'):
             self.duedate_edit.setDateTime(QDateTime.fromString(details.get('duedate'), Qt.ISODate))
         self.subtasks_edit.setText(details.get('subtasks', ''))
 
+# Task list row decorations
+_PRIORITY_ICON = {"High": "🔴", "Medium": "⚪", "Low": "🟢"}
+_STATUS_DONE = "✅ Done"
+_STATUS_PENDING = "⏳ Pending"
+# The three lines every task row starts with
+_HEADER_TMPL = ("{icon} {title}\n"
+                "Status: {status} | Category: {category}\n"
+                "Priority: {priority} | Pomodoros: 🍅 {pomos}")
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value):
+    """Parse a stored ISO timestamp to naive local time, to the second; None if malformed."""
+    try:
+        dt = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is not None:
+        # Offsets from imported data; compare against naive datetime.now()
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt.replace(microsecond=0)
+
+def format_task_item(task, now=None):
+    """Return (text, overdue) for a task row as shown in the task list.
+
+    Pass now when formatting many rows so the clock is read once per refresh.
+    """
+    completed = task["completed"]
+    duedate = task["duedate"]
+    priority = task["priority"]
+    due_dt = _parse_iso(duedate) if duedate else None
+    overdue = bool(due_dt) and not completed and due_dt < (now or datetime.now())
+    due_icon = "🚨 URGENT" if overdue else "📅"
+
+    status = _STATUS_DONE if completed else _STATUS_PENDING
+    priority_icon = _PRIORITY_ICON.get(priority, "⚪")
+
+    task_lines = [_HEADER_TMPL.format(icon=priority_icon, title=task["task"], status=status,
+                                      category=task["category"], priority=priority,
+                                      pomos=task["pomodoros"] or 0)]
+
+    if duedate:
+        if due_dt:
+            task_lines.append(f"Due: {due_icon} {due_dt.strftime('%I:%M %p • %d %b %Y')}")
+        else:
+            task_lines.append(f"Due: {due_icon} {duedate}")
+
+    tags = task["tags"]
+    if tags:
+        task_lines.append(f"Tags: 🏷️ {tags}")
+
+    subtasks = task["subtasks"]
+    if subtasks:
+        task_lines.append(f"Subtasks: 📋 {subtasks}")
+
+    started_at = task["started_at"]
+    started_dt = _parse_iso(started_at) if started_at else None
+    if started_dt:
+        task_lines.append(f"Started: 🚀 {started_dt.strftime('%I:%M %p • %d %b %Y')}")
+    completed_at = task["completed_at"]
+    completed_dt = _parse_iso(completed_at) if completed_at else None
+    if completed_dt:
+        task_lines.append(f"Completed: ✅ {completed_dt.strftime('%I:%M %p • %d %b %Y')}")
+
+    recurring = task["recurring"]
+    if recurring and recurring != 'None':
+        task_lines.append(f"Recurring: 🔄 {recurring}")
+
+    return "\n".join(task_lines), overdue
+
+class TaskModel(QAbstractListModel):
+    """
+    Task rows for the list view, kept in get_tasks_for_display() order
+    (pending first, newest first) and updated one row at a time.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._display = []  # (text, overdue) per row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._display[row][0]
+        if role == Qt.UserRole:
+            # Task ID for reliable Complete/Delete operations
+            try:
+                return int(self._rows[row]["id"])
+            except Exception:
+                return None
+        if role == Qt.ForegroundRole:
+            return QBrush(Qt.red) if self._display[row][1] else None
+        if role == Qt.BackgroundRole:
+            priority = self._rows[row]["priority"]
+            if priority == 'High':
+                return QBrush(Qt.darkRed)
+            if priority == 'Low':
+                return QBrush(Qt.darkGray)
+        return None
+
+    def set_tasks(self, tasks):
+        self.beginResetModel()
+        self._rows = list(tasks)
+        now = datetime.now()
+        self._display = [format_task_item(t, now) for t in self._rows]
+        self.endResetModel()
+
+    def sync(self, tasks):
+        """
+        Bring the rows in line with tasks (in get_tasks_for_display() order) using row
+        removals, inserts and dataChanged, so unchanged rows keep their text,
+        layout and selection.
+        """
+        tasks = list(tasks)
+        new = {t["id"]: t for t in tasks}
+        # Drop rows that are gone or changed group (completed flag), in runs from the end
+        keep = [t["id"] in new and new[t["id"]]["completed"] == t["completed"] for t in self._rows]
+        row = len(keep)
+        while row > 0:
+            if keep[row - 1]:
+                row -= 1
+                continue
+            last = row - 1
+            while row > 0 and not keep[row - 1]:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            del self._rows[row:last + 1]
+            del self._display[row:last + 1]
+            self.endRemoveRows()
+
+        # The survivors have to be in the new order already; otherwise start over
+        kept = {t["id"] for t in self._rows}
+        if [t["id"] for t in self._rows] != [t["id"] for t in tasks if t["id"] in kept]:
+            self.set_tasks(tasks)
+            return
+
+        now = datetime.now()
+        row = j = 0
+        while j < len(tasks):
+            task = tasks[j]
+            if row < len(self._rows) and self._rows[row]["id"] == task["id"]:
+                if self._rows[row] != task or self._overdue_changed(row, now):
+                    self._rows[row] = task
+                    self._display[row] = format_task_item(task, now)
+                    idx = self.index(row)
+                    self.dataChanged.emit(idx, idx)
+                row += 1
+                j += 1
+                continue
+            # New rows up to the next survivor go in as one block
+            start = j
+            while j < len(tasks) and not (row < len(self._rows) and self._rows[row]["id"] == tasks[j]["id"]):
+                j += 1
+            block = tasks[start:j]
+            self.beginInsertRows(QModelIndex(), row, row + len(block) - 1)
+            self._rows[row:row] = block
+            self._display[row:row] = [format_task_item(t, now) for t in block]
+            self.endInsertRows()
+            row += len(block)
+
+    def _overdue_changed(self, row, now):
+        # An unchanged row can still cross its due time between refreshes
+        task = self._rows[row]
+        if task["completed"] or not task["duedate"]:
+            return False
+        due_dt = _parse_iso(task["duedate"])
+        return due_dt is not None and (due_dt < now) != self._display[row][1]
+
+    def row_of(self, task_id):
+        for i, t in enumerate(self._rows):
+            if t["id"] == task_id:
+                return i
+        return -1
+
+    def insert_task(self, task):
+        pos = self._sort_position(task)
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._rows.insert(pos, task)
+        self._display.insert(pos, format_task_item(task))
+        self.endInsertRows()
+
+    def update_task(self, task):
+        row = self.row_of(task["id"])
+        if row < 0:
+            self.insert_task(task)
+            return
+        if self._sort_key(self._rows[row]) != self._sort_key(task):
+            self.remove_task(task["id"])
+            self.insert_task(task)
+            return
+        self._rows[row] = task
+        self._display[row] = format_task_item(task)
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+
+    def remove_task(self, task_id):
+        row = self.row_of(task_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._display[row]
+        self.endRemoveRows()
+
+    @staticmethod
+    def _sort_key(task):
+        # Mirrors ORDER BY completed ASC, id DESC
+        return (1 if task["completed"] else 0, -int(task["id"] or 0))
+
+    def _sort_position(self, task):
+        key = self._sort_key(task)
+        for i, t in enumerate(self._rows):
+            if self._sort_key(t) > key:
+                return i
+        return len(self._rows)
+
 class TaskTracker(QMainWindow):
     def __init__(self):
         super().__init__()
         self._floating = None
         self._tray = None
+        # Dialogs are built on first use and reused afterwards
+        self._stats_dlg = self._help_dlg = self._task_dlg = None
+        # task_id -> row as of the last get_tasks_for_display(); reloaded when marked dirty
+        self._tasks_cache = {}
+        self._tasks_dirty = True
         self.init_ui()
         self.init_tray()
 
+        self._backup_timer = QTimer(self)
+        self._backup_timer.setInterval(BACKUP_INTERVAL_MS)
+        self._backup_timer.timeout.connect(lambda: QThreadPool.globalInstance().start(_BackupTask()))
+        self._backup_timer.start()
+
     def init_ui(self):
+        self.setObjectName("TaskTracker")
         self.setWindowTitle('Routine - Task Tracker & Pomodoro Timer')
         self.setGeometry(400, 120, 1200, 800)
 
-        try:
-            icon = QIcon(resource_path('study.ico'))
-            if not icon.isNull():
-                self.setWindowIcon(icon)
-            else:
-                self.setWindowIcon(QIcon.fromTheme("face-smile"))
-        except:
-            self.setWindowIcon(QIcon.fromTheme("face-smile"))
-
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #14151b, stop:1 #0f1117);
-                color: #ffffff;
-            }
-            QWidget {
-                background: transparent;
-                color: #ffffff;
-                font-family: -apple-system, 'SF Pro Text', 'Segoe UI', Arial, sans-serif;
-            }
-
-            /* Header and Title Styling */
-            QLabel#TitleLabel {
-                background: rgba(255,255,255,0.06);
-                border: 1px solid rgba(255,255,255,0.08);
-                border-radius: 14px;
-                padding: 14px 16px;
-                font-size: 18px;
-                font-weight: 700;
-                color: #f5f6f8;
-            }
-
-            /* Search Bar */
-            QLineEdit#SearchBar {
-                background: rgba(255, 255, 255, 0.08);
-                border: 1px solid rgba(255, 255, 255, 0.10);
-                border-radius: 22px;
-                padding: 12px 20px;
-                color: white;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QLineEdit#SearchBar:focus {
-                border: 1px solid #0a84ff;
-                background: rgba(255, 255, 255, 0.12);
-            }
-            QLineEdit#SearchBar::placeholder {
-                color: rgba(255, 255, 255, 0.6);
-            }
-
-            /* Quick Add Section */
-            QWidget#QuickAddPanel {
-                background: rgba(255, 255, 255, 0.06);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 14px;
-                padding: 16px;
-                backdrop-filter: blur(12px);
-            }
-
-            QLineEdit#QuickAddInput {
-                background: rgba(255, 255, 255, 0.08);
-                border: 1px solid rgba(255, 255, 255, 0.10);
-                border-radius: 12px;
-                padding: 10px 15px;
-                color: white;
-                font-size: 13px;
-            }
-            QLineEdit#QuickAddInput:focus {
-                border: 1px solid #0a84ff;
-            }
-            QLineEdit#QuickAddInput::placeholder {
-                color: rgba(255, 255, 255, 0.5);
-            }
-
-            /* ComboBox Styling */
-            QComboBox {
-                background: rgba(255, 255, 255, 0.08);
-                border: 1px solid rgba(255, 255, 255, 0.10);
-                border-radius: 12px;
-                padding: 10px 15px;
-                color: white;
-                font-size: 13px;
-                font-weight: 500;
-                min-width: 120px;
-            }
-            QComboBox:hover {
-                background: rgba(255, 255, 255, 0.12);
-                border: 1px solid rgba(255, 255, 255, 0.18);
-            }
-            QComboBox:focus {
-                border: 1px solid #0a84ff;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 6px solid transparent;
-                border-right: 6px solid transparent;
-                border-top: 6px solid white;
-                margin-right: 10px;
-            }
-            QComboBox QAbstractItemView {
-                background: #2c3e50;
-                border: 1px solid #34495e;
-                border-radius: 8px;
-                selection-background-color: #667eea;
-                color: white;
-                font-size: 13px;
-            }
-
-            /* Task List */
-            QListWidget {
-                background: rgba(255, 255, 255, 0.05);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 14px;
-                color: white;
-                font-size: 14px;
-                padding: 8px;
-                outline: none;
-            }
-            QListWidget::item {
-                background: rgba(255, 255, 255, 0.045);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-left: 4px solid rgba(10,132,255,0.85);
-                border-radius: 12px;
-                padding: 16px 16px;
-                margin: 4px;
-                font-size: 13px;
-                line-height: 1.4;
-            }
-            QListWidget::item:hover {
-                background: rgba(255, 255, 255, 0.09);
-                border: 1px solid rgba(255, 255, 255, 0.12);
-            }
-            QListWidget::item:selected {
-                background: #0a84ff;
-                border: 1px solid rgba(255, 255, 255, 0.18);
-            }
-
-            /* Button Styling */
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #0a84ff, stop:1 #0a74e6);
-                border: 1px solid rgba(255,255,255,0.08);
-                border-radius: 16px;
-                padding: 12px 20px;
-                color: #ffffff;
-                font-weight: 700;
-                font-size: 13px;
-                min-height: 20px;
-            }
-            QPushButton:hover { background: #0a74e6; }
-            QPushButton:pressed { background: #085fb8; }
-            QPushButton:focus { border: 2px solid rgba(10,132,255,0.65); }
-
-            /* Special Button Styles */
-            QPushButton#QuickAddBtn { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #34c759, stop:1 #2fb14f); }
-            QPushButton#QuickAddBtn:hover { background: #2fb14f; }
-
-            QPushButton#PomodoroBtn { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff9f0a, stop:1 #e28c09); font-size: 16px; padding: 15px 30px; border-radius: 18px; }
-            QPushButton#PomodoroBtn:hover { background: #e28c09; }
-
-            QPushButton#CompleteBtn { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #34c759, stop:1 #2fb14f); }
-            QPushButton#CompleteBtn:hover { background: #2fb14f; }
-
-            QPushButton#DeleteBtn { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff453a, stop:1 #e03d33); }
-            QPushButton#DeleteBtn:hover { background: #e03d33; }
-
-            /* Scrollbar Styling */
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-
-            /* Panel Styling */
-            QWidget#LeftPanel {
-                background: rgba(255, 255, 255, 0.05);
-                border: 1px solid rgba(255, 255, 255, 0.06);
-                border-radius: 14px;
-                padding: 16px;
-            }
-
-            QWidget#RightPanel {
-                background: rgba(255, 255, 255, 0.04);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 14px;
-                padding: 16px;
-            }
-        """)
+        self.setWindowIcon(get_app_icon())
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -1356,7 +1922,13 @@ class TaskTracker(QMainWindow):
         self.search_bar = QLineEdit()
         self.search_bar.setObjectName("SearchBar")
         self.search_bar.setPlaceholderText('🔍 Search tasks, tags, or categories...')
-        self.search_bar.textChanged.connect(self.search_tasks)
+        # Search once typing pauses rather than on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.search_tasks)
+        self.search_bar.textChanged.connect(self._search_timer.start)
+        self.search_bar.returnPressed.connect(self._search_now)
         search_layout.addWidget(self.search_bar)
         left_layout.addLayout(search_layout)
 
@@ -1364,8 +1936,16 @@ class TaskTracker(QMainWindow):
         list_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #667eea; margin-bottom: 5px;")
         left_layout.addWidget(list_label)
 
-        self.task_listbox = QListWidget()
+        self._task_model = TaskModel(self)
+        self.task_listbox = QListView()
+        # Named so the list styles skip combo box popups, which are QListViews too
+        self.task_listbox.setObjectName("TaskList")
         self.task_listbox.setWordWrap(True)  # Enable word wrapping
+        # Rows wrap to different heights, so uniform sizing is off the table;
+        # lay out in batches so large lists don't measure every row up front.
+        self.task_listbox.setLayoutMode(QListView.Batched)
+        self.task_listbox.setBatchSize(50)
+        self.task_listbox.setModel(self._task_model)
         left_layout.addWidget(self.task_listbox)
 
         main_layout.addWidget(left_panel, 6)
@@ -1391,11 +1971,11 @@ class TaskTracker(QMainWindow):
 
         combo_layout = QHBoxLayout()
         self.category_combobox = QComboBox()
-        self.category_combobox.addItems(['📖 Study', '📝 Homework', '💼 Work', '🏠 Personal'])
+        self.category_combobox.addItems(CATEGORIES)
         combo_layout.addWidget(self.category_combobox)
 
         self.priority_quick = QComboBox()
-        self.priority_quick.addItems(['⚪ Medium', '🔴 High', '🟢 Low'])
+        self.priority_quick.addItems(PRIORITIES)
         combo_layout.addWidget(self.priority_quick)
         entry_layout.addLayout(combo_layout)
 
@@ -1494,9 +2074,7 @@ class TaskTracker(QMainWindow):
             return
         self._tray = QSystemTrayIcon(self)
         # Prefer bundled app icon if available
-        icon = QIcon(resource_path('study.ico'))
-        if icon.isNull():
-            icon = QIcon.fromTheme("face-smile")
+        icon = get_app_icon()
         if icon.isNull():
             try:
                 icon = QApplication.style().standardIcon(QStyle.SP_ComputerIcon)
@@ -1507,9 +2085,9 @@ class TaskTracker(QMainWindow):
 
         act_show = QAction("Show Window", self, triggered=self.showNormal)
         act_toggle_pomo = QAction("Toggle Floating Pomodoro", self, triggered=self.toggle_floating_pomodoro)
-        act_start = QAction("Start Pomodoro", self, triggered=lambda: self._floating and self._floating._start())
-        act_pause = QAction("Pause Pomodoro", self, triggered=lambda: self._floating and self._floating._pause())
-        act_reset = QAction("Reset Pomodoro", self, triggered=lambda: self._floating and self._floating._reset())
+        act_start = QAction("Start Pomodoro", self, triggered=self._tray_start)
+        act_pause = QAction("Pause Pomodoro", self, triggered=self._tray_pause)
+        act_reset = QAction("Reset Pomodoro", self, triggered=self._tray_reset)
         act_quit = QAction("Quit", self, triggered=self.close)
 
         menu.addAction(act_show)
@@ -1525,6 +2103,19 @@ class TaskTracker(QMainWindow):
         self._tray.setToolTip("Task Tracker & Pomodoro")
         self._tray.show()
 
+    # Tray actions act on the floating timer only while it exists
+    def _tray_start(self):
+        if self._floating:
+            self._floating._start()
+
+    def _tray_pause(self):
+        if self._floating:
+            self._floating._pause()
+
+    def _tray_reset(self):
+        if self._floating:
+            self._floating._reset()
+
     def toast(self, title, message):
         if self._tray:
             self._tray.showMessage(title, message, QSystemTrayIcon.Information, 4000)
@@ -1533,28 +2124,38 @@ class TaskTracker(QMainWindow):
         title = self.task_entry.text().strip()
         if not title:
             return
-        add_task(
+        task_id = add_task(
             task=title,
-            category=self.category_combobox.currentText(),
+            category=CATEGORY_DB_MAP[self.category_combobox.currentText()],
             duedate=None,
             subtasks="",
-            priority=self.priority_quick.currentText(),
+            priority=PRIORITY_DB_MAP[self.priority_quick.currentText()],
             tags="",
             recurring="None"
         )
         self.task_entry.clear()
-        self.update_tasks()
+        row = get_task_by_id(task_id) if task_id else None
+        if row:
+            self._task_model.insert_task(row)
+            self.invalidate_tasks()
         self.toast("Task added", title)
 
     def show_task_dialog(self):
-        dialog = TaskDialog(self)
+        if self._task_dlg is None:
+            self._task_dlg = TaskDialog(self)
+        else:
+            self._task_dlg.reset()
+        dialog = self._task_dlg
         if dialog.exec_() == QDialog.Accepted:
             d = dialog.get_task_details()
             if not d['title']:
                 QMessageBox.warning(self, "Input", "Task title is required.")
                 return
-            add_task(d['title'], d['category'], d['duedate'], d['subtasks'], d['priority'], d['tags'], d['recurring'])
-            self.update_tasks()
+            task_id = add_task(d['title'], d['category'], d['duedate'], d['subtasks'], d['priority'], d['tags'], d['recurring'])
+            row = get_task_by_id(task_id) if task_id else None
+            if row:
+                self._task_model.insert_task(row)
+                self.invalidate_tasks()
 
     def export_tasks(self):
         path, _ = QFileDialog.getSaveFileName(self, "Save CSV", "", "CSV files (*.csv)")
@@ -1563,11 +2164,12 @@ class TaskTracker(QMainWindow):
                 with open(path, 'w', newline='', encoding='utf-8') as f:
                     writer = csv.writer(f)
                     writer.writerow(["ID","Task","Category","Completed","DueDate","Subtasks","Started At","Completed At","Priority","Tags","Recurring","Pomodoros","Last Pomodoro At"])
-                    for task in get_tasks():
-                        writer.writerow(task)
+                    writer.writerows(iter_tasks())
                 self.toast("Export", "Tasks exported successfully.")
             except IOError:
                 QMessageBox.critical(self, "Error", "Could not save file.")
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, "Database Error", f"Failed to retrieve tasks: {str(e)}")
 
     def import_tasks(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open CSV", "", "CSV files (*.csv)")
@@ -1576,55 +2178,61 @@ class TaskTracker(QMainWindow):
                 with open(path, 'r', encoding='utf-8') as file:
                     reader = csv.reader(file)
                     header = next(reader, None)
-                    conn = sqlite3.connect(DB_PATH)
-                    c = conn.cursor()
-                    for row in reader:
-                        row = row + [None] * (13 - len(row))
-                        (task_id, task_title, task_category, task_completed, task_duedate, task_subtasks,
-                         started_at, completed_at, priority, tags, recurring, pomodoros, last_pomo_at) = row
-                        try:
-                            c.execute("""INSERT OR REPLACE INTO tasks
-                            (id, task, category, completed, duedate, subtasks, started_at, completed_at, priority, tags, recurring, pomodoros, last_pomodoro_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                                      (task_id, task_title, task_category, int(task_completed or 0), task_duedate or None,
-                                       task_subtasks or "", started_at or None, completed_at or None,
-                                       priority or "Medium", tags or "", recurring or "None",
-                                       int(pomodoros or 0), last_pomo_at or None))
-                        except Exception:
-                            continue
-                    conn.commit()
-                    conn.close()
-                self.update_tasks()
+                    # Parse the whole file before taking the write lock
+                    rows = [r for r in map(_norm_import_row, reader) if r is not None]
+                with db_transaction(immediate=True) as conn:
+                    conn.executemany(SQL_IMPORT_TASK, rows)
+                # Let the file dialog close and repaint before the list reloads
+                QTimer.singleShot(0, self.update_tasks)
                 self.toast("Import", "Tasks imported.")
             except IOError:
                 QMessageBox.critical(self, "Error", "Could not open file.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Import failed: {str(e)}")
 
+    def _search_now(self):
+        # Enter skips the typing pause
+        self._search_timer.stop()
+        self.search_tasks()
+
     def search_tasks(self):
-        query = self.search_bar.text().lower().strip()
-        self.task_listbox.clear()
-        tasks = get_tasks()
-        for task in tasks:
-            task_id, title, category, completed, duedate, subtasks, started_at, completed_at, priority, tags, recurring, pomos, last_pomo = task
-            hay = f"{title} {tags}".lower()
-            if query in hay:
-                self._add_task_list_item(task)
+        query = self.search_bar.text().strip()
+        if not query:
+            # Cleared search box: every task, straight from the cache when it is current
+            self._show_tasks(self._cached_tasks().values())
+            return
+        self._show_tasks(search_tasks_db(query))
 
     def complete_task(self):
         selected = self.get_selected_task_row()
         if selected:
-            task_id = selected[0]
-            complete_task_db(task_id)
-            self._handle_recurring(selected)
-            self.update_tasks()
+            task_id = selected["id"]
+            # Completion and the next occurrence commit together or not at all;
+            # the error dialog waits until the rollback has released the lock
+            try:
+                with db_transaction():
+                    _mark_task_done(task_id)
+                    next_id = self._handle_recurring(selected)
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, "Database Error", f"Failed to complete task: {str(e)}")
+                return
+            # Patch the list in place rather than reloading every task
+            row = get_task_by_id(task_id)
+            if row:
+                self._task_model.update_task(row)
+            row = get_task_by_id(next_id) if next_id else None
+            if row:
+                self._task_model.insert_task(row)
+            self.invalidate_tasks()
 
     def delete_task(self):
         selected = self.get_selected_task_row()
         if selected:
-            task_id = selected[0]
-            delete_task_db(task_id)
-            self.update_tasks()
+            task_id = selected["id"]
+            if not delete_task_db(task_id):
+                return
+            self._task_model.remove_task(task_id)
+            self._tasks_cache.pop(task_id, None)
 
     def open_settings(self):
         dialog = SettingsDialog(self)
@@ -1634,10 +2242,16 @@ class TaskTracker(QMainWindow):
             self._floating._on_phase_change(self._floating.manager.phase, self._floating.manager.remaining, self._floating._format(self._floating.manager.remaining))
 
     def show_help(self):
-        HelpDialog(self).exec_()
+        if self._help_dlg is None:
+            self._help_dlg = HelpDialog(self)
+        self._help_dlg.exec_()
 
     def show_stats(self):
-        StatsDialog(self).exec_()
+        if self._stats_dlg is None:
+            self._stats_dlg = StatsDialog(self)
+        else:
+            self._stats_dlg.refresh()
+        self._stats_dlg.exec_()
 
     def toggle_floating_pomodoro(self):
         if self._floating and self._floating.isVisible():
@@ -1652,121 +2266,74 @@ class TaskTracker(QMainWindow):
             self._floating.show()
             self._floating.raise_()
 
-    def _add_task_list_item(self, task_tuple):
-        (task_id, title, category, completed, duedate, subtasks, started_at, completed_at,
-         priority, tags, recurring, pomos, last_pomo) = task_tuple
-
-        status = "✅ Done" if completed else "⏳ Pending"
-        priority_icon = {"High": "🔴", "Medium": "⚪", "Low": "🟢"}.get(priority, "⚪")
-
-        task_lines = []
-
-        task_lines.append(f"{priority_icon} {title}")
-
-        task_lines.append(f"Status: {status} | Category: {category}")
-
-        task_lines.append(f"Priority: {priority} | Pomodoros: 🍅 {pomos or 0}")
+    def invalidate_tasks(self):
+        """Mark the task cache stale after a write; the next read reloads it."""
+        self._tasks_dirty = True
 
-        if duedate:
-            try:
-                dt = datetime.strptime(duedate.split('.')[0], '%Y-%m-%dT%H:%M:%S')
-                task_lines.append(f"Due: 📅 {dt.strftime('%I:%M %p • %d %b %Y')}")
-            except Exception:
-                task_lines.append(f"Due: 📅 {duedate}")
-
-        if tags:
-            task_lines.append(f"Tags: 🏷️ {tags}")
-
-        if subtasks:
-            task_lines.append(f"Subtasks: 📋 {subtasks}")
-
-        if started_at:
-            try:
-                started_time = datetime.strptime(started_at.split('.')[0], '%Y-%m-%dT%H:%M:%S').strftime('%I:%M %p • %d %b %Y')
-                task_lines.append(f"Started: 🚀 {started_time}")
-            except Exception:
-                pass
-        if completed_at:
-            try:
-                completed_time = datetime.strptime(completed_at.split('.')[0], '%Y-%m-%dT%H:%M:%S').strftime('%I:%M %p • %d %b %Y')
-                task_lines.append(f"Completed: ✅ {completed_time}")
-            except Exception:
-                pass
+    def refresh_task(self, task_id):
+        """Re-read one task written outside the list and update its row if shown."""
+        self.invalidate_tasks()
+        if self._task_model.row_of(task_id) < 0:
+            return
+        row = get_task_by_id(task_id)
+        if row:
+            self._task_model.update_task(row)
 
-        if recurring and recurring != 'None':
-            task_lines.append(f"Recurring: 🔄 {recurring}")
+    def _cached_tasks(self):
+        if self._tasks_dirty:
+            self._tasks_cache = {t["id"]: t for t in get_tasks_for_display()}
+            self._tasks_dirty = False
+        return self._tasks_cache
 
-        item_text = "\n".join(task_lines)
+    def update_tasks(self):
+        # Explicit reload; searches and selection lookups reuse the result
+        self._tasks_dirty = True
+        self._show_tasks(self._cached_tasks().values())
 
-        list_item = QListWidgetItem()
-        list_item.setText(item_text)
-        # Store the task ID for reliable Complete/Delete operations
+    def _show_tasks(self, tasks):
+        # One repaint after the diffed update instead of one per row insert, removal or change
+        self.task_listbox.setUpdatesEnabled(False)
         try:
-            list_item.setData(Qt.UserRole, int(task_id))
-        except Exception:
-            pass
-        self.task_listbox.addItem(list_item)
-
-        if duedate:
-            try:
-                due_dt = datetime.strptime(duedate.split('.')[0], "%Y-%m-%dT%H:%M:%S")
-                if due_dt < datetime.now() and not completed:
-                    list_item.setForeground(Qt.red)
-                    urgent_text = item_text.replace("📅", "🚨 URGENT")
-                    list_item.setText(urgent_text)
-            except Exception:
-                pass
-
-        if priority == 'High':
-            list_item.setBackground(Qt.darkRed)
-        elif priority == 'Low':
-            list_item.setBackground(Qt.darkGray)
-
-    def update_tasks(self):
-        self.task_listbox.clear()
-        for t in get_tasks():
-            self._add_task_list_item(t)
+            self._task_model.sync(tasks)
+        finally:
+            self.task_listbox.setUpdatesEnabled(True)
 
     def get_selected_task_row(self):
-        idx = self.task_listbox.currentRow()
-        if idx < 0:
-            return None
-        item = self.task_listbox.item(idx)
-        if not item:
+        index = self.task_listbox.currentIndex()
+        if not index.isValid():
             return None
-        task_id = item.data(Qt.UserRole)
+        task_id = index.data(Qt.UserRole)
         if task_id is None:
             return None
-        for t in get_tasks():
-            if t[0] == task_id:
-                return t
-        return None
+        if self._tasks_dirty:
+            # One indexed lookup instead of reloading every row
+            return get_task_by_id(task_id)
+        return self._tasks_cache.get(task_id)
 
     def _handle_recurring(self, task_row):
-        (task_id, title, category, completed, duedate, subtasks, started_at, completed_at,
-         priority, tags, recurring, pomos, last_pomo) = task_row
+        recurring = task_row["recurring"]
+        duedate = task_row["duedate"]
         if not recurring or recurring == 'None':
-            return
+            return None
         next_due = None
-        try:
-            if duedate:
-                base = datetime.strptime(duedate.split('.')[0], '%Y-%m-%dT%H:%M:%S')
-            else:
-                base = datetime.now()
+        base = _parse_iso(duedate) if duedate else datetime.now()
+        if base is not None:
             if recurring == 'Daily':
                 next_due = (base + timedelta(days=1)).isoformat()
             elif recurring == 'Weekly':
                 next_due = (base + timedelta(weeks=1)).isoformat()
-        except Exception:
-            next_due = None
 
-        add_task(task=title, category=category, duedate=next_due, subtasks=subtasks,
-                 priority=priority, tags=tags, recurring=recurring)
+        return _insert_task(task_row["task"], task_row["category"], next_due,
+                            task_row["subtasks"], task_row["priority"],
+                            task_row["tags"], recurring)
 
     def closeEvent(self, event):
         try:
             if self._floating and self._floating.manager:
                 self._floating.manager.save_current_session()
+            flush_study_time()
+            # Let a running periodic backup finish before the final one
+            QThreadPool.globalInstance().waitForDone()
             backup_db()
         except Exception:
             pass
@@ -1775,6 +2342,7 @@ class TaskTracker(QMainWindow):
 if __name__ == "__main__":
     init_db()
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(flush_study_time)
     app.setStyle('Fusion')
     apply_global_theme(app)
     window = TaskTracker()